@@ -28,7 +28,7 @@ from frozendict import frozendict
 from pydantic_extra_types.semantic_version import SemanticVersion
 
 from . import extyp
-from .pydeps import BLExtDeps, PyDepWheel, uv
+from .pydeps import BLExtDeps, PyDepWheel, downloaded_wheels, uv
 from .utils.inline_script_metadata import parse_inline_script_metadata
 from .utils.lru_method import lru_method
 from .utils.pydantic_frozendict import FrozenDict
@@ -676,13 +676,12 @@ class BLExtSpec(pyd.BaseModel, frozen=True):
 		bl_platforms: frozenset[extyp.BLPlatformSet] | None = None,
 	) -> frozenset[PyDepWheel]:
 		"""Wheels that have already been correctly downloaded."""
-		return frozenset({
-			wheel
-			for wheel in self.query_required_wheels(
+		return downloaded_wheels(
+			self.query_required_wheels(
 				bl_versions=bl_versions, bl_platforms=bl_platforms
-			)
-			if wheel.is_download_valid(path_wheels / wheel.filename)
-		})
+			),
+			path_wheels=path_wheels,
+		)
 
 	@lru_method()
 	def query_missing_wheels(
@@ -692,14 +691,18 @@ class BLExtSpec(pyd.BaseModel, frozen=True):
 		bl_versions: frozenset[extyp.BLVersion] | None = None,
 		bl_platforms: frozenset[extyp.BLPlatformSet] | None = None,
 	) -> frozenset[PyDepWheel]:
-		"""Wheels that need to be downloaded, since they are not available / valid."""
-		return frozenset({
-			wheel
-			for wheel in self.query_required_wheels(
-				bl_versions=bl_versions, bl_platforms=bl_platforms
-			)
-			if not wheel.is_download_valid(path_wheels / wheel.filename)
-		})
+		"""Wheels that need to be downloaded, since they are not available / valid.
+
+		Notes:
+			Reuses `self.query_cached_wheels`, so each existing wheel is only hashed once.
+		"""
+		return self.query_required_wheels(
+			bl_versions=bl_versions, bl_platforms=bl_platforms
+		) - self.query_cached_wheels(
+			path_wheels=path_wheels,
+			bl_versions=bl_versions,
+			bl_platforms=bl_platforms,
+		)
 
 	####################
 	# - Queries: Prepack
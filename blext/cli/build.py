@@ -49,6 +49,7 @@ def build(  # noqa: C901, PLR0912, PLR0913, PLR0915
 	] = None,
 	overwrite: bool = True,
 	vendor: bool = True,
+	compression: pack.ZipCompression = 'deflate',
 	check_output: bool = True,
 ) -> None:
 	"""Build an extension project.
@@ -66,6 +67,8 @@ def build(  # noqa: C901, PLR0912, PLR0913, PLR0915
 		overwrite: Allow overwriting `.zip`.
 		vendor: Include dependencies as wheels in the `.zip`.
 			When `False`, write `uv.lock` to the extension.
+		compression: Compression method of files in the `.zip`.
+			`lzma` often produces smaller extensions, but packs more slowly.
 		check_output: Run `blext check` on the packed `.zip`.
 	"""
 	blext_info = blext_info.parse_proj(proj)
@@ -306,6 +309,7 @@ def build(  # noqa: C901, PLR0912, PLR0913, PLR0915
 			files_in_prepack_cache = pack.existing_prepacked_files(
 				files_in_prepack[bl_version][bl_platform],
 				path_zip_prepack=path_zip_prepacks[bl_version][bl_platform],
+				compression=compression,
 			)
 			CONSOLE.print(
 				rich.markdown.Markdown(
@@ -327,6 +331,7 @@ def build(  # noqa: C901, PLR0912, PLR0913, PLR0915
 				pack.prepack_extension(
 					files_to_prepack,
 					path_zip_prepack=path_zip_prepacks[bl_version][bl_platform],
+					compression=compression,
 					cb_pre_file_write=ui_callbacks.cb_pre_file_write,  # pyright: ignore[reportArgumentType]
 					cb_post_file_write=ui_callbacks.cb_post_file_write,  # pyright: ignore[reportArgumentType]
 				)
@@ -351,6 +356,7 @@ def build(  # noqa: C901, PLR0912, PLR0913, PLR0915
 				path_zip_prepack=path_zip_prepacks[bl_version][bl_platform],
 				path_zip=path_zips[bl_version][bl_platform],
 				path_pysrc=blext_location.path_pysrc(blext_spec.id),
+				compression=compression,
 			)
 
 			# Move Extension from Build Cache Dir to Build Dir
@@ -36,6 +36,7 @@ import pydantic as pyd
 import semver.version
 from frozendict import frozendict
 
+from blext.utils.lru_method import lru_method
 from blext.utils.pydantic_frozendict import FrozenDict
 
 from .bl_manifest_version import BLManifestVersion
@@ -314,6 +315,7 @@ class BLVersion(pyd.BaseModel, frozen=True):
 
 		return implementation_version
 
+	@lru_method()
 	def pymarker_environments(
 		self,
 		*,
@@ -340,6 +342,8 @@ class BLVersion(pyd.BaseModel, frozen=True):
 			- `sys_platform`: Derived from each valid `BLVersion`.
 				- **Source**: Derived from target's `sys.platform`: <https://docs.python.org/3/library/sys.html#sys.platform>
 
+			Memoized per `pkg_name`, since every marker check for this `BLVersion` reads this table.
+
 		See Also:
 			- Official Environment Marker Grammer: https://packaging.python.org/en/latest/specifications/dependency-specifiers/#environment-markers
 			- Reference for `packaging.markers.Environment`: <https://packaging.pypa.io/en/stable/markers.html#packaging.markers.Environment>
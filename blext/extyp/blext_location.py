@@ -24,6 +24,8 @@ from pathlib import Path
 
 import pydantic as pyd
 
+from blext.utils.lru_method import lru_method
+
 BLEXT_PROJ_CACHE_DIRNAME = '.blext_cache'
 HASH_ALGO_SCRIPTPATH = 'sha256'
 
@@ -108,6 +110,7 @@ class BLExtLocation(pyd.BaseModel, frozen=True):
 		msg = f"Extension project path ({self.path_spec}) is neither a script extension or a project extension. This shouldn't happen."
 		raise RuntimeError(msg)
 
+	@lru_method()
 	def path_pysrc(self, pkg_name: str) -> Path:
 		"""Path to the extension source code.
 
@@ -122,9 +125,9 @@ class BLExtLocation(pyd.BaseModel, frozen=True):
 		if self.is_project_extension:
 			package_path = self.path_spec.parent / pkg_name
 			if package_path.is_dir():
-				return self.path_spec.parent / pkg_name
+				return package_path
 
-			msg = f'The extension project name, {pkg_name}, does not have a Python package with the same name at: {self.path_spec.parent / pkg_name}'
+			msg = f'The extension project name, {pkg_name}, does not have a Python package with the same name at: {package_path}'
 			raise ValueError(msg)
 
 		if self.is_script_extension:
@@ -16,9 +16,17 @@
 
 """Packing and pre-packing of Blender extension zipfiles from a specification and raw files."""
 
+import collections
+import collections.abc
+import concurrent.futures
+import functools
+import json
+import os
 import shutil
+import types
 import typing as typ
 import zipfile
+import zlib
 from pathlib import Path
 
 from frozendict import frozendict
@@ -26,19 +34,334 @@ from frozendict import frozendict
 from . import extyp
 from .blext_spec import BLExtSpec
 
+####################
+# - Constants
+####################
+## Supported compression methods of files in packed zipfiles.
+## - 'deflate': Supported by every zip tool. The default.
+## - 'lzma': Often much smaller, at the cost of slower packing.
+## - 'stored': No compression, for the fastest packing.
+ZipCompression: typ.TypeAlias = typ.Literal['deflate', 'lzma', 'stored']
+ZIP_COMPRESS_TYPES: frozendict[ZipCompression, int] = frozendict({
+	'deflate': zipfile.ZIP_DEFLATED,
+	'lzma': zipfile.ZIP_LZMA,
+	'stored': zipfile.ZIP_STORED,
+})
+ZIP_COMPRESSLEVEL = 6  ## zlib's default, which `_write_file_pipelined` relies on.
+ZIP_CHUNK_BYTES = 2**20  ## Granularity of reading large files while compressing.
+
+## Files compressed in parallel are held in memory, along with their compressed data.
+## - Larger files are streamed into the zipfile in chunks, instead.
+## - At most `2 * max_workers` files are in flight at once.
+ZIP_PARALLEL_MAX_BYTES = 4 * ZIP_CHUNK_BYTES
+ZIP_THREADS = os.cpu_count() or 1
+
+## Timestamp of all files generated during packing, ex. `blender_manifest.toml`.
+## - A fixed timestamp makes generated files reproducible, given the same contents.
+## - 1980-01-01 is the earliest timestamp that a zipfile can represent.
+ZIP_GENERATED_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+## Implementation of `zlib` to use for DEFLATE compression in `pack_files`.
+## - `zlib-ng` is a drop-in replacement for `zlib`, with much faster compression.
+## - It is optional (`blext[zlib-ng]`): When it isn't installed, the standard library `zlib` is used.
+## - Files streamed through `zipfile` itself are always compressed with the standard library `zlib`.
+DEFLATE_ZLIB: types.ModuleType
+try:
+	from zlib_ng import zlib_ng as DEFLATE_ZLIB  # pyright: ignore[reportMissingImports]  # noqa: N812
+except ImportError:
+	DEFLATE_ZLIB = zlib
+
+
+def _generated_zip_info(filename: str, *, compress_type: int) -> zipfile.ZipInfo:
+	"""Zipfile entry for a file generated during packing, with a fixed timestamp.
+
+	Notes:
+		`external_attr` is left unset, so `ZipFile.writestr` applies its usual `?rw-------` permissions.
+	"""
+	zip_info = zipfile.ZipInfo(filename, date_time=ZIP_GENERATED_DATE_TIME)
+	zip_info.compress_type = compress_type
+	return zip_info
+
+
+####################
+# - Pre-Compressed Files
+####################
+def _deflate_file(path: str, *, compresslevel: int) -> tuple[int, int, bytes]:
+	"""Read and compress a file to a raw DEFLATE stream, as used by zipfiles.
+
+	Notes:
+		Compression releases the GIL, so this function may be run in parallel by several threads.
+
+	Parameters:
+		path: Path to the file to compress.
+		compresslevel: The DEFLATE compression level to use.
+
+	Returns:
+		The CRC32 of the uncompressed data, the uncompressed size, and the compressed data.
+	"""
+	with open(path, 'rb') as f_file:  # noqa: PTH123
+		data = f_file.read()
+
+	compressor = DEFLATE_ZLIB.compressobj(compresslevel, zlib.DEFLATED, -15)  # pyright: ignore[reportAny]
+	return (
+		zlib.crc32(data),
+		len(data),
+		compressor.compress(data) + compressor.flush(),  # pyright: ignore[reportAny]
+	)
+
+
+def _write_deflated(
+	f_zip: zipfile.ZipFile,
+	zip_info: zipfile.ZipInfo,
+	*,
+	crc: int,
+	file_size: int,
+	deflated: bytes,
+) -> None:
+	"""Write a pre-compressed DEFLATE stream to a zipfile.
+
+	Notes:
+		`zipfile` has no public API for writing pre-compressed data.
+		Therefore, this mirrors `ZipFile.open(zip_info, 'w')`, except that the CRC and sizes are already known when the local file header is written.
+
+	Parameters:
+		f_zip: Seekable zipfile, opened for writing.
+		zip_info: Information about the file to write.
+		crc: CRC32 of the uncompressed data.
+		file_size: Size of the uncompressed data.
+		deflated: The raw DEFLATE stream, ex. from `_deflate_file`.
+	"""
+	zip_info.compress_type = zipfile.ZIP_DEFLATED
+	zip_info.flag_bits = 0x00
+	zip_info.CRC = crc
+	zip_info.file_size = file_size
+	zip_info.compress_size = len(deflated)
+	zip64 = max(file_size, len(deflated)) > zipfile.ZIP64_LIMIT
+
+	if f_zip.fp is None:
+		msg = f'Tried to write `{zip_info.filename}` to a zipfile that was already closed.'
+		raise ValueError(msg)
+
+	## Like 'ZipFile.writestr', hold the zipfile's lock while its file is written to.
+	with f_zip._lock:  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]  # noqa: SLF001
+		if f_zip._writing:  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]  # noqa: SLF001
+			msg = f'Tried to write `{zip_info.filename}` to a zipfile, while another write handle is open on it.'
+			raise ValueError(msg)
+
+		_ = f_zip.fp.seek(f_zip.start_dir)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType, reportUnknownArgumentType]
+		zip_info.header_offset = f_zip.fp.tell()
+		f_zip._writecheck(zip_info)  # pyright: ignore[reportAttributeAccessIssue, reportUnknownMemberType]  # noqa: SLF001
+		f_zip._didModify = True  # pyright: ignore[reportAttributeAccessIssue]  # noqa: SLF001
+
+		_ = f_zip.fp.write(zip_info.FileHeader(zip64))
+		_ = f_zip.fp.write(deflated)
+
+		f_zip.start_dir = f_zip.fp.tell()  # pyright: ignore[reportAttributeAccessIssue]
+		f_zip.filelist.append(zip_info)
+		f_zip.NameToInfo[zip_info.filename] = zip_info
+
+
+def _write_file_pipelined(
+	f_zip: zipfile.ZipFile,
+	path: str | Path,
+	zip_info: zipfile.ZipInfo,
+	*,
+	reader: concurrent.futures.ThreadPoolExecutor,
+) -> None:
+	"""Write a large file to a zipfile, reading the next chunk while the current chunk is compressed.
+
+	Notes:
+		Equivalent to `f_zip.write(path, zipfile_path)`, which reads, computes the CRC of, and compresses each chunk one after the other.
+
+		Here, the next chunk is read by `reader` while the current chunk is checksummed and compressed.
+		Both file reads and `zlib` release the GIL, so the two overlap.
+
+		`zipfile` has no public way to give a `ZipInfo` a compression level.
+		Without one, `zlib`'s default level is used, which is also `ZIP_COMPRESSLEVEL`.
+
+	Parameters:
+		f_zip: Zipfile, opened for writing.
+		path: Host path of the file to write.
+		zip_info: Information about the file to write, ex. from `zipfile.ZipInfo.from_file`.
+		reader: Executor that reads chunks from the file.
+			Should have exactly one worker, such that reads happen in order.
+	"""
+	zip_info.compress_type = f_zip.compression
+
+	with open(path, 'rb') as f_file, f_zip.open(zip_info, 'w') as f_zipped:  # noqa: PTH123
+		next_chunk = reader.submit(f_file.read, ZIP_CHUNK_BYTES)
+		while chunk := next_chunk.result():
+			next_chunk = reader.submit(f_file.read, ZIP_CHUNK_BYTES)
+			_ = f_zipped.write(chunk)
+
+
+####################
+# - Pack Files
+####################
+def pack_files(
+	f_zip: zipfile.ZipFile,
+	paths_files: collections.abc.Iterable[str],
+	*,
+	path_root: str | Path,
+	max_workers: int = ZIP_THREADS,
+) -> None:
+	"""Write host files to a zipfile, at their path relative to `path_root`.
+
+	Notes:
+		With DEFLATE compression, files are read and compressed in parallel, then written in order.
+		Compression releases the GIL, so the threads do run in parallel.
+
+		At most `2 * max_workers` files are in flight at once, which bounds the memory held by compressed data.
+		Files larger than `ZIP_PARALLEL_MAX_BYTES` are streamed in chunks instead, like `ZipFile.write`.
 
+		Other compression methods write each file with `ZipFile.write`, one after the other.
+
+	Parameters:
+		f_zip: Seekable zipfile, opened for writing.
+		paths_files: Host paths of the files to write.
+		path_root: Folder that the path of each file within the zipfile is relative to.
+		max_workers: Maximum number of files to compress at the same time.
+	"""
+	if f_zip.compression != zipfile.ZIP_DEFLATED:
+		for path_file in paths_files:
+			f_zip.write(path_file, os.path.relpath(path_file, path_root))
+		return
+
+	deflate_file = functools.partial(
+		_deflate_file,
+		compresslevel=zlib.Z_DEFAULT_COMPRESSION
+		if f_zip.compresslevel is None
+		else f_zip.compresslevel,
+	)
+	with (
+		concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool,
+		concurrent.futures.ThreadPoolExecutor(max_workers=1) as reader,
+	):
+		## - Files are written in the order given, no matter which finishes compressing first.
+		## - Streamed files have no future; they are read once it's their turn to be written.
+		files_in_flight: collections.deque[
+			tuple[
+				str,
+				zipfile.ZipInfo,
+				concurrent.futures.Future[tuple[int, int, bytes]] | None,
+			]
+		] = collections.deque()
+
+		def write_next_file() -> None:
+			path_file, zip_info, file_deflated = files_in_flight.popleft()
+			if file_deflated is None:
+				_write_file_pipelined(f_zip, path_file, zip_info, reader=reader)
+			else:
+				crc, file_size, deflated = file_deflated.result()
+				_write_deflated(
+					f_zip, zip_info, crc=crc, file_size=file_size, deflated=deflated
+				)
+
+		for path_file in paths_files:
+			zip_info = zipfile.ZipInfo.from_file(
+				path_file, os.path.relpath(path_file, path_root)
+			)
+			files_in_flight.append((
+				path_file,
+				zip_info,
+				pool.submit(deflate_file, path_file)
+				if zip_info.file_size <= ZIP_PARALLEL_MAX_BYTES
+				else None,
+			))
+			if len(files_in_flight) >= 2 * max_workers:
+				write_next_file()
+
+		while files_in_flight:
+			write_next_file()
+
+
+####################
+# - Prepack Manifest
+####################
+def _file_signature(path: Path) -> tuple[int, int]:
+	"""Cheap signature of a host file, used to detect whether its pre-packed copy is stale."""
+	stat_result = path.stat()
+	return (stat_result.st_size, stat_result.st_mtime_ns)
+
+
+def path_prepack_manifest(path_zip_prepack: Path) -> Path:
+	"""Path to the sidecar manifest of a pre-packed zipfile.
+
+	Notes:
+		The manifest maps each zipfile path to the `(size, mtime_ns)` of the host file that was packed there.
+		This allows deducing whether a pre-packed file is stale, without re-reading it.
+
+	Parameters:
+		path_zip_prepack: Path to a pre-packed zipfile.
+
+	Returns:
+		Path to a `.zip.manifest` file next to `path_zip_prepack`.
+	"""
+	return path_zip_prepack.with_name(path_zip_prepack.name + '.manifest')
+
+
+def read_prepack_manifest(path_zip_prepack: Path) -> dict[str, tuple[int, int]]:
+	"""Read the sidecar manifest of a pre-packed zipfile.
+
+	Parameters:
+		path_zip_prepack: Path to a pre-packed zipfile.
+
+	Returns:
+		Mapping from zipfile paths to `(size, mtime_ns)` of the host file that was packed there.
+		When no (valid) manifest exists, an empty mapping is returned.
+	"""
+	## NOTE: Opening directly saves probing for the file beforehand.
+	try:
+		with path_prepack_manifest(path_zip_prepack).open('r') as f_manifest:
+			raw_manifest: dict[str, list[int]] = json.load(f_manifest)  # pyright: ignore[reportAny]
+	except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError):
+		return {}
+
+	return {
+		zipfile_path: (file_size, file_mtime_ns)
+		for zipfile_path, (file_size, file_mtime_ns) in raw_manifest.items()
+	}
+
+
+def write_prepack_manifest(
+	path_zip_prepack: Path,
+	prepack_manifest: dict[str, tuple[int, int]],
+) -> None:
+	"""Write the sidecar manifest of a pre-packed zipfile.
+
+	Parameters:
+		path_zip_prepack: Path to a pre-packed zipfile.
+		prepack_manifest: Mapping from zipfile paths to `(size, mtime_ns)` of the host file that was packed there.
+	"""
+	with path_prepack_manifest(path_zip_prepack).open('w') as f_manifest:
+		json.dump(prepack_manifest, f_manifest)
+
+
+####################
+# - Prepack Cache
+####################
 def existing_prepacked_files(
 	all_files_to_prepack: frozendict[Path, Path] | dict[Path, Path],
 	*,
 	path_zip_prepack: Path,
+	compression: ZipCompression = 'deflate',
 ) -> frozenset[Path]:
 	"""Determine which files do not need to be pre-packed again, since they already exist in a pre-packed zipfile.
 
+	Notes:
+		A file is only considered to be pre-packed if the size and modification time of its host file matches that which was recorded in the pre-pack manifest.
+
+		Files packed with a different `compression` are also considered stale.
+
+		When any file in the pre-packed zipfile is either superfluous or stale, the entire pre-packed zipfile is deleted.
+
 	Parameters:
 		all_files_to_prepack: Mapping from host files to files in the zip.
 			All files specified here should be available in the final pre-packed zip.
 		path_zip_prepack: Path to an existing pre-packed zipfile.
 			If no file exists, then all files are assumed to need pre-packing.
+		compression: Compression method that pre-packed files should have.
 
 	Returns:
 		Set of files that need to be pre-packed.
@@ -47,22 +370,43 @@ def existing_prepacked_files(
 		`blext.pack.prepack_extension`: The output should be passed to this function, to perform the actual pre-packing.
 	"""
 	if path_zip_prepack.is_file():
+		# Compare Names as Strings
+		## - Zipfile member names always use '/', like 'Path.as_posix()'.
+		## - No 'Path' is constructed per member; the caller's 'Path's are reused.
 		with zipfile.ZipFile(path_zip_prepack, 'r') as f_zip:
-			existing_prepacked_files = set({Path(name) for name in f_zip.namelist()})
+			compress_types_by_zipfile_name = {
+				zip_info.filename: zip_info.compress_type
+				for zip_info in f_zip.infolist()
+			}
+		existing_zipfile_names = frozenset(compress_types_by_zipfile_name)
 
 		# Re-Pack to Delete Files
 		## - Deleting a single file from a .zip archive is not always a good idea.
 		## - See https://github.com/python/cpython/pull/103033
 		## - Instead, when a file should be deleted, we repack the entire `.zip`.
-		_files_to_prepack_values = frozenset(all_files_to_prepack.values())
+		## - Stale files (size/mtime differs from the manifest) must also be deleted.
+		## - So must files with a different compression method.
+		prepack_manifest = read_prepack_manifest(path_zip_prepack)
+		host_paths_by_zipfile_name = {
+			zipfile_path.as_posix(): path
+			for path, zipfile_path in all_files_to_prepack.items()
+		}
+		compress_type = ZIP_COMPRESS_TYPES[compression]
 		if any(
-			existing_zipfile_path not in _files_to_prepack_values
-			for existing_zipfile_path in existing_prepacked_files
+			zipfile_name not in host_paths_by_zipfile_name
+			or compress_types_by_zipfile_name[zipfile_name] != compress_type
+			or prepack_manifest.get(zipfile_name)
+			!= _file_signature(host_paths_by_zipfile_name[zipfile_name])
+			for zipfile_name in existing_zipfile_names
 		):
 			path_zip_prepack.unlink()
-			existing_prepacked_files.clear()
+			path_prepack_manifest(path_zip_prepack).unlink(missing_ok=True)
+			return frozenset()
 
-		return frozenset(existing_prepacked_files)
+		return frozenset(
+			all_files_to_prepack[host_paths_by_zipfile_name[zipfile_name]]
+			for zipfile_name in existing_zipfile_names
+		)
 	return frozenset()
 
 
@@ -73,8 +417,9 @@ def prepack_extension(
 	files_to_prepack: frozendict[Path, Path] | dict[Path, Path],
 	*,
 	path_zip_prepack: Path,
-	cb_pre_file_write: typ.Callable[[Path, Path], typ.Any] = lambda *_: None,  # pyright: ignore[reportUnknownLambdaType]
-	cb_post_file_write: typ.Callable[[Path, Path], typ.Any] = lambda *_: None,  # pyright: ignore[reportUnknownLambdaType]
+	compression: ZipCompression = 'deflate',
+	cb_pre_file_write: typ.Callable[[Path, Path], typ.Any] | None = None,
+	cb_post_file_write: typ.Callable[[Path, Path], typ.Any] | None = None,
 ) -> None:
 	"""Pre-pack zipfile containing large files, but not the extension code.
 
@@ -92,10 +437,11 @@ def prepack_extension(
 		files_to_prepack: Mapping from host files to files in the zip.
 			All files specified here will be packed.
 		path_zip_prepack: The zip file to pre-pack.
+		compression: Compression method of the pre-packed files.
 		cb_pre_file_write: Called before each file is written to the zip.
-			Defaults is no-op.
+			When `None`, nothing is called.
 		cb_post_file_write: Called after each file is written to the zip.
-			Defaults is no-op.
+			When `None`, nothing is called.
 
 	Raises:
 		ValueError: When not all wheels required by `blext_spec` are found in `path_wheels`.
@@ -104,10 +450,28 @@ def prepack_extension(
 		- `blext.pack.existing_prepacked_files`: Use to pre-filter `files_to_prepack`,
 		in order to only pack files that aren't already present.
 	"""
-	file_sizes = {path: path.stat().st_size for path in files_to_prepack}
-
-	# Create Zipfile
-	with zipfile.ZipFile(path_zip_prepack, 'a', zipfile.ZIP_DEFLATED) as f_zip:
+	# Nothing to Pre-Pack
+	## - When the pre-packed zip exists already, it is not even opened.
+	## - Appending would parse and (on close) rewrite its central directory for nothing.
+	prepack_exists = path_zip_prepack.is_file()
+	if not files_to_prepack and prepack_exists:
+		return
+
+	file_signatures = {path: _file_signature(path) for path in files_to_prepack}
+	file_sizes = {path: file_size for path, (file_size, _) in file_signatures.items()}
+
+	# Create or Append to Zipfile
+	## - Only append when there is an existing pre-packed zip to append to.
+	## - Otherwise, a fresh zip is streamed out without reading anything first.
+	with (
+		zipfile.ZipFile(
+			path_zip_prepack,
+			'a' if prepack_exists else 'w',
+			compression=ZIP_COMPRESS_TYPES[compression],
+			compresslevel=ZIP_COMPRESSLEVEL,
+		) as f_zip,
+		concurrent.futures.ThreadPoolExecutor(max_workers=1) as reader,
+	):
 		####################
 		# - INSTALL: Files => /wheels/*.whl
 		####################
@@ -116,9 +480,25 @@ def prepack_extension(
 		for path, zipfile_path in sorted(
 			remaining_files_to_prepack.items(), key=lambda el: file_sizes[el[0]]
 		):
-			cb_pre_file_write(path, zipfile_path)
-			f_zip.write(path, zipfile_path)
-			cb_post_file_write(path, zipfile_path)
+			if cb_pre_file_write is not None:
+				cb_pre_file_write(path, zipfile_path)
+			_write_file_pipelined(
+				f_zip,
+				path,
+				zipfile.ZipInfo.from_file(path, zipfile_path),
+				reader=reader,
+			)
+			if cb_post_file_write is not None:
+				cb_post_file_write(path, zipfile_path)
+
+	# Record Pre-Packed Files
+	## - Only done once all files were written, so an aborted pre-pack is never trusted.
+	prepack_manifest = read_prepack_manifest(path_zip_prepack)
+	prepack_manifest.update({
+		zipfile_path.as_posix(): file_signatures[path]
+		for path, zipfile_path in files_to_prepack.items()
+	})
+	write_prepack_manifest(path_zip_prepack, prepack_manifest)
 
 
 ####################
@@ -133,6 +513,7 @@ def pack_bl_extension(  # noqa: PLR0913
 	path_zip_prepack: Path,
 	path_zip: Path,
 	path_pysrc: Path,
+	compression: ZipCompression = 'deflate',
 	cb_update_status: typ.Callable[[str], list[None] | None] = lambda *_: None,  # pyright: ignore[reportUnknownLambdaType]
 ) -> None:
 	"""Pack all files needed by a Blender extension, into an installable `.zip`.
@@ -146,23 +527,29 @@ def pack_bl_extension(  # noqa: PLR0913
 		path_zip_prepack: Path to the prepacked zipfile.
 		path_zip: Path to the zipfile to pack.
 		path_pysrc: Path to the Python source code to pack as the extension package.
+		compression: Compression method of the packed files.
+			Should match the compression of the pre-packed zipfile.
 	"""
 	if not path_zip_prepack.is_file():
 		msg = f'Cannot pack extension, since no pre-packed extension was found at {path_zip_prepack}.'
 		raise RuntimeError(msg)
 
 	# Overwrite Existing ZIP
-	if path_zip.is_file():
-		if not overwrite:
-			msg = f'File already exists where extension ZIP is to be built: {path_zip}'
-			raise ValueError(msg)
-		path_zip.unlink()
+	## - 'shutil.copyfile' truncates any existing file, so it needn't be deleted first.
+	if not overwrite and path_zip.is_file():
+		msg = f'File already exists where extension ZIP is to be built: {path_zip}'
+		raise ValueError(msg)
 
 	# Copy Pre-Packed ZIP
 	_ = cb_update_status('Copying Pre-Packed Extension ZIP')
 	_ = shutil.copyfile(path_zip_prepack, path_zip)
 
-	with zipfile.ZipFile(path_zip, 'a', zipfile.ZIP_DEFLATED) as f_zip:
+	with zipfile.ZipFile(
+		path_zip,
+		'a',
+		compression=ZIP_COMPRESS_TYPES[compression],
+		compresslevel=ZIP_COMPRESSLEVEL,
+	) as f_zip:
 		####################
 		# - INSTALL: Blender Manifest => /blender_manifest.toml
 		####################
@@ -176,8 +563,9 @@ def pack_bl_extension(  # noqa: PLR0913
 		_ = cb_update_status(f'Writing `{manifest_filename}`')
 
 		f_zip.writestr(
-			manifest_filename,
-			bl_manifest_strs[bl_version][bl_platform],
+			_generated_zip_info(manifest_filename, compress_type=f_zip.compression),
+			bl_manifest_strs[bl_version][bl_platform].encode('utf-8'),
+			compresslevel=ZIP_COMPRESSLEVEL,
 		)
 
 		####################
@@ -186,8 +574,12 @@ def pack_bl_extension(  # noqa: PLR0913
 		if blext_spec.release_profile is not None:
 			_ = cb_update_status('Writing Release Profile to `init_settings.toml`')
 			f_zip.writestr(
-				blext_spec.release_profile.init_settings_filename,
-				blext_spec.release_profile.export(fmt='toml'),
+				_generated_zip_info(
+					blext_spec.release_profile.init_settings_filename,
+					compress_type=f_zip.compression,
+				),
+				blext_spec.release_profile.export(fmt='toml').encode('utf-8'),
+				compresslevel=ZIP_COMPRESSLEVEL,
 			)
 
 		####################
@@ -196,21 +588,28 @@ def pack_bl_extension(  # noqa: PLR0913
 		# Project: Write Extension Python Package
 		if path_pysrc.is_dir():
 			_ = cb_update_status('Writing Python Files')
-			for file_to_zip in path_pysrc.rglob('*'):
-				f_zip.write(
-					file_to_zip,
-					file_to_zip.relative_to(path_pysrc),
+
+			# Walk w/os.walk
+			## - Unlike 'Path.rglob', no 'Path' is constructed (and stat'ed) for every entry.
+			## - Only files are written; directory entries are implied by file paths.
+			paths_files: list[str] = []
+			for path_dir, _, filenames in os.walk(path_pysrc):
+				paths_files.extend(
+					os.path.join(path_dir, filename)  # noqa: PTH118
+					for filename in filenames
 				)
 
+			pack_files(f_zip, paths_files, path_root=path_pysrc)
+
 		# Script: Write Script String as __init__.py
 		elif path_pysrc.is_file():
 			_ = cb_update_status('Writing Extension Script to __init__.py')
-			with path_pysrc.open('r') as f_pysrc:
-				pysrc = f_pysrc.read()
 
+			# Copy Script Bytes
+			## - The script is never decoded, since it would only be re-encoded.
 			f_zip.writestr(
 				'__init__.py',
-				pysrc,
+				path_pysrc.read_bytes(),
 			)
 		else:
 			msg = "Tried to pack an extension that is neither a project nor a script. This shouldn't happen."
@@ -19,7 +19,7 @@
 from . import uv
 from .blext_deps import BLExtDeps
 from .pydep import PyDep
-from .pydep_download import download_wheel, download_wheels
+from .pydep_download import download_wheel, download_wheels, downloaded_wheels
 from .pydep_marker import PyDepMarker
 from .pydep_wheel import PyDepWheel
 
@@ -30,6 +30,7 @@ __all__ = [
 	'PyDepWheel',
 	'download_wheel',
 	'download_wheels',
+	'downloaded_wheels',
 	'pydep',
 	'uv',
 ]
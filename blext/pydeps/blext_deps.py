@@ -16,22 +16,50 @@
 
 """Tools for managing wheel-based dependencies."""
 
+import collections
 import functools
+import itertools
+import sys
 import typing as typ
 
-import networkx as nx
 import packaging.utils
 import pydantic as pyd
 import semver.version
 from frozendict import frozendict
 
 from blext import extyp
+from blext.utils.lru_method import lru_method
 from blext.utils.pydantic_frozendict import FrozenDict
 
 from .pydep import PyDep
 from .pydep_marker import PyDepMarker
 from .pydep_wheel import PyDepWheel
 
+if typ.TYPE_CHECKING:
+	import networkx as nx
+
+####################
+# - Constants
+####################
+## Maps each separator allowed in package names to `-`, like `packaging.utils.canonicalize_name`.
+PYDEP_NAME_SEPARATOR_TABLE = str.maketrans('_.', '--')
+
+
+####################
+# - Utilities
+####################
+@functools.cache
+def nrm_name(pkg_name: str) -> str:
+	"""Normalize and intern a package name, at most once per unique package name.
+
+	Notes:
+		Equivalent to `packaging.utils.canonicalize_name`, whose regex is only needed to collapse runs of separators.
+	"""
+	nrm_pkg_name = pkg_name.translate(PYDEP_NAME_SEPARATOR_TABLE).lower()
+	if '--' in nrm_pkg_name:
+		nrm_pkg_name = packaging.utils.canonicalize_name(pkg_name)
+	return sys.intern(nrm_pkg_name)
+
 
 class BLExtDeps(pyd.BaseModel, frozen=True):
 	"""All Python dependencies needed by a Blender extension."""
@@ -63,52 +91,215 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 			return semver.version.Version(*self.min_macos_version_tuple)
 		return None
 
+	@functools.cached_property
+	def pydep_versions_by_name(self) -> frozendict[str, tuple[str, ...]]:
+		"""All versions of each PyDep in `self.pydeps`, indexed by PyDep name."""
+		pydep_versions_by_name: dict[str, list[str]] = {}
+		for pydep_name, pydep_version in self.pydeps:
+			pydep_versions_by_name.setdefault(pydep_name, []).append(pydep_version)
+
+		return frozendict({
+			pydep_name: tuple(pydep_versions)
+			for pydep_name, pydep_versions in pydep_versions_by_name.items()
+		})
+
 	####################
 	# - PyDeps Dependency Graph
 	####################
 	@functools.cached_property
-	def pydeps_graph(self) -> nx.DiGraph:  # pyright: ignore[reportMissingTypeArgument, reportUnknownParameterType]
-		"""Dependency-graph representation of `self.pydeps`."""
+	def pydeps_upstream(
+		self,
+	) -> frozendict[
+		tuple[str, str], tuple[tuple[tuple[str, str], PyDepMarker | None], ...]
+	]:
+		"""The direct dependencies of each `(pydep_name, pydep_version)`, alongside the marker of each dependency-edge.
+
+		Notes:
+			A dependency-edge may have a "marker", denoting a conditional dependency.
+
+			The keys of `self.pydeps` are reused as-is as nodes, instead of building equal tuples per edge.
+		"""
+		pydep_nodes_by_name: dict[str, list[tuple[str, str]]] = {}
+		for node in self.pydeps:
+			pydep_nodes_by_name.setdefault(node[0], []).append(node)
+
+		return frozendict({
+			node_downstream: tuple([
+				(node_upstream, dependency_marker)
+				for pydep_upstream_name, dependency_marker in pydep_downstream.deps.items()
+				for node_upstream in pydep_nodes_by_name.get(pydep_upstream_name, ())
+			])
+			for node_downstream, pydep_downstream in self.pydeps.items()
+		})
+
+	@functools.cached_property
+	def pydeps_downstream(
+		self,
+	) -> frozendict[tuple[str, str], tuple[tuple[str, str], ...]]:
+		"""The direct dependents of each `(pydep_name, pydep_version)`."""
+		pydeps_downstream: dict[tuple[str, str], list[tuple[str, str]]] = {
+			node: [] for node in self.pydeps
+		}
+		for node_downstream, nodes_upstream in self.pydeps_upstream.items():
+			for node_upstream, _ in nodes_upstream:
+				pydeps_downstream[node_upstream].append(node_downstream)
+
+		return frozendict({
+			node: tuple(nodes_downstream)
+			for node, nodes_downstream in pydeps_downstream.items()
+		})
+
+	@functools.cached_property
+	def pydep_nodes(self) -> tuple[tuple[str, str], ...]:
+		"""All `(pydep_name, pydep_version)` nodes, in sorted order.
+
+		Notes:
+			The index of each node is used as its integer ID.
+			Integers are much cheaper to hash and compare than `tuple[str, str]`, which is why graph walks use them.
+		"""
+		return tuple(sorted(self.pydeps))
+
+	@functools.cached_property
+	def pydep_ids(self) -> frozendict[tuple[str, str], int]:
+		"""The integer ID of each `(pydep_name, pydep_version)` node, as indexed in `self.pydep_nodes`."""
+		return frozendict({node: i for i, node in enumerate(self.pydep_nodes)})
+
+	@functools.cached_property
+	def pydeps_upstream_ids(
+		self,
+	) -> tuple[tuple[tuple[int, PyDepMarker | None], ...], ...]:
+		"""Variant of `self.pydeps_upstream` that uses integer IDs, indexed by the integer ID of each node."""
+		pydep_ids = self.pydep_ids
+		pydeps_upstream = self.pydeps_upstream
+		return tuple([
+			tuple([
+				(pydep_ids[node_upstream], dependency_marker)
+				for node_upstream, dependency_marker in pydeps_upstream[node]
+			])
+			for node in self.pydep_nodes
+		])
+
+	@functools.cached_property
+	def pydep_markers(self) -> frozenset[PyDepMarker]:
+		"""All distinct markers found on any dependency-edge."""
+		return frozenset({
+			dependency_marker
+			for nodes_upstream in self.pydeps_upstream.values()
+			for _, dependency_marker in nodes_upstream
+			if dependency_marker is not None
+		})
+
+	@functools.cached_property
+	def pydeps_graph(self) -> 'nx.DiGraph':  # pyright: ignore[reportMissingTypeArgument, reportUnknownParameterType]
+		"""Dependency-graph representation of `self.pydeps`.
+
+		Notes:
+			`blext` itself walks `self.pydeps_upstream` and `self.pydeps_downstream` instead.
+			This is only kept for external consumers.
+			`networkx` is therefore imported lazily, so that it isn't loaded on `blext`'s hot path.
+		"""
+		import networkx as nx  # noqa: PLC0415
+
 		pydeps_graph = nx.DiGraph()  # pyright: ignore[reportUnknownVariableType]
 
 		## Add Nodes as Package Names
-		## - Each node is annotated with a PyDepPyDepWheel
-		pydeps_graph.add_nodes_from(  # pyright: ignore[reportUnknownMemberType]
-			(
-				(pydep_name, pydep_version),
-				{'pydep': pydep},
-			)
-			for (pydep_name, pydep_version), pydep in self.pydeps.items()
-		)
+		## - Nodes carry no data. The PyDep of each node is `self.pydeps[node]`.
+		pydeps_graph.add_nodes_from(self.pydeps)  # pyright: ignore[reportUnknownMemberType]
 
-		## Add Edges w/Markers
-		## - Each edge may have a "marker" denoting a conditional dependency.
+		## Add Edges
+		## - Edges carry no data. The marker of each edge is found in `self.pydeps_upstream`.
 		pydeps_graph.add_edges_from(  # pyright: ignore[reportUnknownMemberType]
-			(
-				(
-					pydep_upstream_name,
-					pydep_upsteam_version,
-				),
-				(pydep_downstream_name, pydep_downstream_version),
-				{'marker': dependency_marker},
-			)
-			for (
-				pydep_downstream_name,
-				pydep_downstream_version,
-			), pydep_downstream in self.pydeps.items()
-			for pydep_upstream_name, dependency_marker in pydep_downstream.deps.items()
-			for pydep_upsteam_version in [
-				pydep_version
-				for pydep_name, pydep_version in self.pydeps
-				if pydep_upstream_name == pydep_name
-			]
+			(node_upstream, node_downstream)
+			for node_downstream, nodes_upstream in self.pydeps_upstream.items()
+			for node_upstream, _ in nodes_upstream
 		)
 
 		return pydeps_graph  # pyright: ignore[reportUnknownVariableType]
 
+	@functools.cached_property
+	def pydeps_leaf_descendants(
+		self,
+	) -> frozendict[tuple[str, str], frozenset[tuple[str, str]]]:
+		"""The leaf nodes that (transitively) depend on each `(pydep_name, pydep_version)`.
+
+		Notes:
+			Leaf nodes have no downstream dependents, and are therefore what causes each PyDep to be included.
+
+			The reachable leaves are a structural property of the full graph, so they're found once for all nodes.
+			This is done in reverse topological order, such that each node just merges the results of its direct dependents.
+
+			Dependency cycles can't be ordered like this.
+			Nodes that are on (or upstream of) a cycle instead walk all of their descendants.
+		"""
+		pydeps_upstream = self.pydeps_upstream
+		pydeps_downstream = self.pydeps_downstream
+
+		# Merge Leaves of Direct Dependents
+		## - A node is ready once all of its dependents have been processed.
+		## - Leaves are ready immediately; they only ever get merged as themselves.
+		## - Equal sets of leaves are common (ex. diamond dependencies), so one instance of each is shared.
+		leaf_descendants: dict[tuple[str, str], frozenset[tuple[str, str]]] = {}
+		shared_leaf_descendants: dict[
+			frozenset[tuple[str, str]], frozenset[tuple[str, str]]
+		] = {}
+		share_leaf_descendants = shared_leaf_descendants.setdefault
+		num_unprocessed_downstream = {
+			node: len(nodes_downstream)
+			for node, nodes_downstream in pydeps_downstream.items()
+		}
+		ready_nodes = collections.deque(
+			node
+			for node, num_downstream in num_unprocessed_downstream.items()
+			if num_downstream == 0
+		)
+		while ready_nodes:
+			node = ready_nodes.popleft()
+			node_leaf_descendants = frozenset().union(*[
+				leaf_descendants[node_downstream]
+				if pydeps_downstream[node_downstream]
+				else (node_downstream,)
+				for node_downstream in pydeps_downstream[node]
+			])
+			leaf_descendants[node] = share_leaf_descendants(
+				node_leaf_descendants, node_leaf_descendants
+			)
+			for node_upstream, _ in pydeps_upstream[node]:
+				num_unprocessed_downstream[node_upstream] -= 1
+				if num_unprocessed_downstream[node_upstream] == 0:
+					ready_nodes.append(node_upstream)
+
+		# Walk Descendants of Cyclic Nodes
+		## - Visiting order doesn't matter, so a plain list is used as a stack.
+		for node in self.pydeps:
+			if node in leaf_descendants:
+				continue
+
+			visited_nodes: set[tuple[str, str]] = set()
+			unvisited_nodes = list(pydeps_downstream[node])
+			add_visited_node = visited_nodes.add
+			push_unvisited_nodes = unvisited_nodes.extend
+			pop_unvisited_node = unvisited_nodes.pop
+			while unvisited_nodes:
+				node_downstream = pop_unvisited_node()
+				if node_downstream not in visited_nodes:
+					add_visited_node(node_downstream)
+					push_unvisited_nodes(pydeps_downstream[node_downstream])
+
+			node_leaf_descendants = frozenset({
+				node_downstream
+				for node_downstream in visited_nodes
+				if not pydeps_downstream[node_downstream]
+			})
+			leaf_descendants[node] = share_leaf_descendants(
+				node_leaf_descendants, node_leaf_descendants
+			)
+
+		return frozendict(leaf_descendants)
+
 	####################
 	# - PyDeps Filtering
 	####################
+	@lru_method()
 	def pydeps_by(
 		self,
 		*,
@@ -116,7 +307,11 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 		bl_version: extyp.BLVersion,
 		bl_platform: extyp.BLPlatform,
 	) -> frozendict[str, PyDep]:
-		"""All Python dependencies needed by the given Python environment."""
+		"""All Python dependencies needed by the given Python environment.
+
+		Notes:
+			Memoized per `(pkg_name, bl_version, bl_platform)`, since `self` is immutable.
+		"""
 		# Buckle up kids!
 		## I confused myself repeatedly, so I wrote some comments to help myself.
 		## The journey begins with a quick little check.
@@ -124,53 +319,28 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 			msg = f'The given `bl_platform` in `{bl_platform}` is not supported by the given Blender version (`{bl_version.pretty_version}`).'
 			raise ValueError(msg)
 
-		# Now a function. Getting spicier!
-		## Go read the documentation below. It's made with love <3
-		def filter_edge(
-			node_upstream: tuple[str, str],
-			node_downstream: tuple[str, str],
-		) -> bool:
-			"""Don't follow dependency-edges with incompatible environment markers.
-
-			Notes:
-				Many PyDeps will include a dependency "only if" something is true.
-				For example, "only if" on Windows.
-				Naturally, this presents a complication: **How do we know what the end-user's Python environment is like**?
-
-				Luckily, `bl_version` and `bl_platform` provide a nearly-complete description of the end-user's Python environment.
-
-				Using this, we can evaluate any markers against the theoretical end-user Python environment, thus providing a dependency graph traversal that is correct for the given parameters.
-			"""
-			pydep_marker = self.pydeps_graph[node_upstream][node_downstream]['marker']  # pyright: ignore[reportAny, reportUnknownMemberType]
-
-			return pydep_marker is None or pydep_marker.is_valid_for(  # pyright: ignore[reportAny]
+		# Now a set. Getting spicier!
+		## Don't follow dependency-edges with incompatible environment markers.
+		## - Many PyDeps will include a dependency "only if" something is true.
+		## - For example, "only if" on Windows.
+		## - Naturally, this presents a complication: **How do we know what the end-user's Python environment is like**?
+		## - Luckily, `bl_version` and `bl_platform` provide a nearly-complete description of the end-user's Python environment.
+		## - Using this, we can evaluate any markers against the theoretical end-user Python environment, thus providing a dependency graph traversal that is correct for the given parameters.
+		## Edges are many, but distinct markers are few. So, each marker is evaluated once, up-front.
+		## Following an edge then only takes a set-membership check. Made with love <3
+		valid_pydep_markers = frozenset({
+			pydep_marker
+			for pydep_marker in self.pydep_markers
+			if pydep_marker.is_valid_for(
 				pkg_name=pkg_name,
 				bl_version=bl_version,
 				bl_platform=bl_platform,
 			)
+		})
 
 		# Now, let's deduce which 'pydep_name's the user actually asked for.
 		## **If** the user specified markers, then we check and respect them.
 		## **Don't** include targets that are vendored by Blender.
-		pydep_target_names = {
-			pydep_target_name
-			for pydep_target_name, pydep_marker in self.target_pydeps.items()
-			if (
-				# The `pydep_name` may not be one of the BLVersion's vendored site-packages.
-				## If it is, we don't error - we just do nothing; let Blender provide it.
-				pydep_target_name not in bl_version.vendored_site_packages
-				# Should there be a (user-defined) marker, we naturally make sure it's valid.
-				## This is the one case not covered by `filter_edge`.
-				and (
-					pydep_marker is None
-					or pydep_marker.is_valid_for(
-						pkg_name=pkg_name,
-						bl_version=bl_version,
-						bl_platform=bl_platform,
-					)
-				)
-			)
-		}
 		## NOTE: Blender-vendored pydeps are allowed to only have an sdist.
 		## - Blender does a lot of its own building of dependencies.
 		## - This is sensible. Look what we have to do to play with pydeps.
@@ -181,23 +351,33 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 		## - We deal with this by never letting them progress to "finding wheels"...
 		## - ...since no wheels would be able to be found.
 		## - This works. Kind of. Egh.
-
-		# We need a fuller story than just `pydep_name` - we need (pydep_name, pydep_version)!
-		## There should be exactly one of these, otherwise something is very wrong.
-		## That's why you're here, isn't it? *Sigh*.
+		vendored_site_packages = bl_version.vendored_site_packages
+		pydep_versions_by_name = self.pydep_versions_by_name
 		pydep_targets: set[tuple[str, str]] = set()
-		for pydep_target_name in pydep_target_names:
-			all_targets_for_name = [
-				(pydep_target_name, pydep_version)
-				for pydep_name, pydep_version in self.pydeps
-				if pydep_target_name == pydep_name
-			]
+		for pydep_target_name, pydep_marker in self.target_pydeps.items():
+			# The `pydep_name` may not be one of the BLVersion's vendored site-packages.
+			## If it is, we don't error - we just do nothing; let Blender provide it.
+			if pydep_target_name in vendored_site_packages:
+				continue
+
+			# Should there be a (user-defined) marker, we naturally make sure it's valid.
+			## This is the one case not covered by `valid_pydep_markers`.
+			if pydep_marker is not None and not pydep_marker.is_valid_for(
+				pkg_name=pkg_name,
+				bl_version=bl_version,
+				bl_platform=bl_platform,
+			):
+				continue
 
-			if len(all_targets_for_name) == 1:
-				pydep_targets.add(all_targets_for_name[0])
+			# We need a fuller story than just `pydep_name` - we need (pydep_name, pydep_version)!
+			## There should be exactly one of these, otherwise something is very wrong.
+			## That's why you're here, isn't it? *Sigh*.
+			pydep_target_versions = pydep_versions_by_name.get(pydep_target_name, ())
+			if len(pydep_target_versions) == 1:
+				pydep_targets.add((pydep_target_name, pydep_target_versions[0]))
 
 			else:
-				amount_str = 'More than one' if len(all_targets_for_name) > 1 else 'No'
+				amount_str = 'More than one' if len(pydep_target_versions) > 1 else 'No'
 				msgs = [
 					f'{amount_str} version of a user-provided target dependency `{pydep_target_name}` was found. **This is a bug in `blext`**.',
 					f'> - **Version**: `{bl_version}`',
@@ -205,8 +385,8 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 					f'> - **Target Name**: `{pydep_target_name}`',
 					'> - **Found Targets**:',
 					*[
-						f'>     {i}. `{pydep_target}`'
-						for i, pydep_target in enumerate(all_targets_for_name)
+						f'>     {i}. `{(pydep_target_name, pydep_version)}`'
+						for i, pydep_version in enumerate(pydep_target_versions)
 					],
 				]
 				raise ValueError(*msgs)
@@ -214,29 +394,45 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 		# Compute non-vendored ancestors of all target (pydep_name, pydep_version).
 		## Now that we have the targets, we need to recursively find all their dependencies.
 		## This includes checking each edge for marker validity.
-		## No need to refer to Knuth. Just `nx.ancestors` and `nx.subgraph_view`.
-		## `networkx` is really nice, did I mention that?
-		valid_pydep_ancestors: set[tuple[str, str]] = {
-			(pydep_ancestor_name, pydep_ancestor_version)
-			for pydep_target_name, pydep_target_version in pydep_targets
-			for pydep_ancestor_name, pydep_ancestor_version in nx.ancestors(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-				nx.subgraph_view(
-					self.pydeps_graph,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-					filter_edge=filter_edge,
-				),
-				(pydep_target_name, pydep_target_version),
-			)
-			if pydep_ancestor_name not in bl_version.vendored_site_packages
-		}
+		## All targets are walked at once, so shared dependencies are only visited once.
+		## Knuth would be proud. Or at least not disappointed.
+		## NOTE: Vendored pydeps are never entered, so their dependencies aren't walked either.
+		## - Blender provides them, and thus also provides whatever they depend on.
+		## - Everything touched per-edge is bound to a local beforehand.
+		## - Nodes are walked as integer IDs, which index into a visited-bitmap.
+		pydep_nodes = self.pydep_nodes
+		pydeps_upstream_ids = self.pydeps_upstream_ids
+		pydep_ids = self.pydep_ids
+		pydep_target_ids = [pydep_ids[pydep_target] for pydep_target in pydep_targets]
+		is_valid_pydep_ancestor = bytearray(len(pydep_nodes))
+		for pydep_target_id in pydep_target_ids:
+			is_valid_pydep_ancestor[pydep_target_id] = 1
+
+		unvisited_pydep_ids = collections.deque(pydep_target_ids)
+		push_unvisited_pydep_id = unvisited_pydep_ids.append
+		pop_unvisited_pydep_id = unvisited_pydep_ids.popleft
+		while unvisited_pydep_ids:
+			for id_upstream, pydep_marker in pydeps_upstream_ids[
+				pop_unvisited_pydep_id()
+			]:
+				if (
+					not is_valid_pydep_ancestor[id_upstream]
+					and pydep_nodes[id_upstream][0] not in vendored_site_packages
+					and (pydep_marker is None or pydep_marker in valid_pydep_markers)
+				):
+					is_valid_pydep_ancestor[id_upstream] = 1
+					push_unvisited_pydep_id(id_upstream)
 
 		# You've found a return statement.
 		## But will you ever be the same?
 		## For now, have a cookie.
+		## NOTE: Node IDs are assigned in sorted order, so the bitmap is already sorted.
+		## NOTE: Contains all targets, and no elements from bl_version.vendored_site_packages.
+		pydeps = self.pydeps
 		return frozendict({
-			pydep_name: self.pydeps[(pydep_name, pydep_version)]
-			for pydep_name, pydep_version in sorted(
-				pydep_targets | valid_pydep_ancestors,
-				## NOTE: Neither has elements from bl_version.vendored_site_packages.
+			pydep_nodes[pydep_id][0]: pydeps[pydep_nodes[pydep_id]]
+			for pydep_id in itertools.compress(
+				range(len(pydep_nodes)), is_valid_pydep_ancestor
 			)
 		})
 
@@ -259,72 +455,87 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 		Notes:
 			Computed from `self.validated_graph`.
 		"""
-		# I know it looks like a monster, but give it a chance, eh?
-		## Even monsters deserve love. [1]
-		## [1]: Shrek (2001)
-		wheels = {
-			pydep: pydep.select_wheel(
+		# Resolve the wheel constraints once, instead of once per pydep.
+		## 'None' overrides fall back to the property from `bl_version`.
+		min_glibc_version = (
+			bl_version.min_glibc_version
+			if self.min_glibc_version is None
+			else self.min_glibc_version
+		)
+		min_macos_version = (
+			bl_version.min_macos_version
+			if self.min_macos_version is None
+			else self.min_macos_version
+		)
+		valid_python_tags = (
+			bl_version.valid_python_tags
+			if self.valid_python_tags is None
+			else self.valid_python_tags
+		)
+		valid_abi_tags = (
+			bl_version.valid_abi_tags
+			if self.valid_abi_tags is None
+			else self.valid_abi_tags
+		)
+		pydeps_leaf_descendants = self.pydeps_leaf_descendants
+		err_msgs_by_platform = err_msgs[bl_version] if err_msgs is not None else None
+
+		def select_wheel(pydep: PyDep) -> PyDepWheel | None:
+			"""Select the best wheel for `pydep`, under the resolved constraints."""
+			return pydep.select_wheel(
 				bl_platform=bl_platform,
-				min_glibc_version=(
-					bl_version.min_glibc_version
-					if self.min_glibc_version is None
-					else self.min_glibc_version
-				),
-				min_macos_version=(
-					bl_version.min_macos_version
-					if self.min_macos_version is None
-					else self.min_macos_version
-				),
-				valid_python_tags=(
-					bl_version.valid_python_tags
-					if self.valid_python_tags is None
-					else self.valid_python_tags
-				),
-				valid_abi_tags=(
-					bl_version.valid_abi_tags
-					if self.valid_abi_tags is None
-					else self.valid_abi_tags
-				),
-				target_descendants=frozenset({  # pyright: ignore[reportUnknownArgumentType]
-					node
-					for node in nx.descendants(  # pyright: ignore[reportUnknownVariableType, reportUnknownMemberType]
-						self.pydeps_graph,  # pyright: ignore[reportUnknownArgumentType, reportUnknownMemberType]
-						(pydep.name, pydep.version_string),
-					)
-					if self.pydeps_graph.out_degree(node) == 0  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-				}),
-				err_msgs=err_msgs[bl_version] if err_msgs is not None else None,
+				min_glibc_version=min_glibc_version,
+				min_macos_version=min_macos_version,
+				valid_python_tags=valid_python_tags,
+				valid_abi_tags=valid_abi_tags,
+				target_descendants=pydeps_leaf_descendants[  # pyright: ignore[reportArgumentType]
+					(pydep.name, pydep.version_string)
+				],
+				err_msgs=err_msgs_by_platform,
 			)
-			for pydep in self.pydeps_by(
-				pkg_name=pkg_name,
-				bl_version=bl_version,
-				bl_platform=bl_platform,
-			).values()
-		}
 
-		# Return the monster if every pydep/platform has a wheel.
-		num_missing_wheels = sum(1 if wheel is None else 0 for wheel in wheels.values())
-		if num_missing_wheels == 0:
-			return frozenset(wheels.values())  # pyright: ignore[reportReturnType]
+		pydeps = self.pydeps_by(
+			pkg_name=pkg_name,
+			bl_version=bl_version,
+			bl_platform=bl_platform,
+		)
 
-		# Otherwise, if error-passthrough is enabled, trust the caller to make good decisions.
-		if err_msgs is not None and err_num_missing_wheels is not None:
-			err_num_missing_wheels[bl_version][bl_platform] = num_missing_wheels
-			return frozenset[PyDepWheel](
-				filter(  # pyright: ignore[reportArgumentType]
-					lambda el: el is not None,
-					wheels.values(),
-				)
-			)
+		# Without error-passthrough, the first missing wheel is already fatal.
+		## No need to keep selecting wheels for all the remaining pydeps.
+		if err_msgs is None or err_num_missing_wheels is None:
+			wheels_strict: set[PyDepWheel] = set()
+			for pydep in pydeps.values():
+				wheel = select_wheel(pydep)
+				if wheel is None:
+					msg = f'While running `deps.wheels_by`, no wheel was found for `{pydep.name}=={pydep.version_string}` in `{bl_version}:{bl_platform}`.'
+					raise ValueError(msg)
+				wheels_strict.add(wheel)
 
-		msg = f'While running `deps.wheels_by`, `{num_missing_wheels}` wheels were missing from `{bl_version}:{bl_platform}`.'
-		raise ValueError(msg)
+			return frozenset(wheels_strict)
+
+		# I know it looks like a monster, but give it a chance, eh?
+		## Even monsters deserve love. [1]
+		## Missing wheels are counted as we go, so the wheels only need one pass.
+		## [1]: Shrek (2001)
+		wheels: set[PyDepWheel] = set()
+		num_missing_wheels = 0
+		for pydep in pydeps.values():
+			wheel = select_wheel(pydep)
+			if wheel is None:
+				num_missing_wheels += 1
+			else:
+				wheels.add(wheel)
+
+		# If any wheels are missing, trust the caller to make good decisions.
+		if num_missing_wheels > 0:
+			err_num_missing_wheels[bl_version][bl_platform] = num_missing_wheels
+		return frozenset(wheels)
 
 	####################
 	# - Creation
 	####################
 	@classmethod
-	def from_uv_lock(
+	def from_uv_lock(  # noqa: C901
 		cls,
 		uv_lock: frozendict[str, typ.Any],
 		*,
@@ -344,71 +555,89 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 				- **Project Extensions**: The package folder name, such that `<module_name>/__init__.py` exists and has the extension's `register()` method.
 				- `BLExtSpec.id`: The
 		"""
-		module_name = packaging.utils.canonicalize_name(module_name)
+
+		@functools.cache
+		def pydep_marker(marker_str: str) -> PyDepMarker:
+			"""Parse a marker, at most once per unique marker string.
+
+			Notes:
+				The same few markers tend to recur on many dependency-edges.
+				Sharing one `PyDepMarker` per string also shares the memoized `PyDepMarker.is_valid_for`.
+			"""
+			return PyDepMarker(marker_str=marker_str)
+
+		module_name = nrm_name(module_name)
 
 		####################
 		# - Stage 1: Parse [[package]]
 		####################
 		## - Projects: [[package]] list has extension package AND only upstream dependencies.
 		## - Single-File Scripts: [[package]] list has only upstream dependencies.
-		if 'package' not in uv_lock:
-			pydeps: dict[tuple[str, str], PyDep] = {}  ## No PyDeps
-		else:
-			pydeps_set = {
-				PyDep(
-					name=package['name'],  # pyright: ignore[reportAny]
-					version_string=package['version'],  # pyright: ignore[reportAny]
-					registry=package['source']['registry'],  # pyright: ignore[reportAny]
-					wheels=frozenset({
-						PyDepWheel(
-							url=wheel_info['url'],  # pyright: ignore[reportAny]
-							registry=package['source']['registry'],  # pyright: ignore[reportAny]
-							hash=wheel_info.get('hash'),  # pyright: ignore[reportAny]
-							size=wheel_info.get('size'),  # pyright: ignore[reportAny]
-						)
-						for wheel_info in package.get('wheels', [])  # pyright: ignore[reportAny]
-						if 'url' in wheel_info
-					}),
-					deps=frozendict({
-						dependency['name']: (
-							PyDepMarker(marker_str=dependency['marker'])  # pyright: ignore[reportAny]
-							if 'marker' in dependency
-							else None
-						)
-						for dependency in [  # pyright: ignore[reportAny]
-							# Always include mandatory dependencies.
-							*package.get('dependencies', []),  # pyright: ignore[reportAny]
-							# Always include "all" optional dependencies.
-							## - uv has already worked out which optional deps are needed.
-							## - Unused [optional-dependencies] simply aren't in uv.lock.
-							## - So, it's safe to pretend that they are all normal dependencies.
-							*[
-								resolved_opt_dependency
-								for resolved_opt_dependencies in package.get(  # pyright: ignore[reportAny]
-									'optional-dependencies',
-									{},
-								).values()
-								for resolved_opt_dependency in resolved_opt_dependencies  # pyright: ignore[reportAny]
-							],
-						]
-					}),
-				)
-				for package in uv_lock['package']  # pyright: ignore[reportAny]
-				if (
-					# Package must have a name.
-					'name' in package
-					# Package must have a version.
-					and 'version' in package
-					# Package must have a registry URL.
-					and 'source' in package
-					and 'registry' in package['source']
-					# Package must not be the "current" package.
-					## - We've made the decision not to consider the root (L0) package as a PyDep.
-					and module_name
-					!= packaging.utils.canonicalize_name(package['name'])  # pyright: ignore[reportAny]
+		## - The root package is found in the same pass, for use in Stage 2.
+		pydeps: dict[tuple[str, str], PyDep] = {}
+		root_package: dict[str, typ.Any] | None = None
+		for package in uv_lock.get('package', ()):  # pyright: ignore[reportAny]
+			# Package must have a name.
+			if 'name' not in package:
+				continue
+
+			# Package must not be the "current" package.
+			## - We've made the decision not to consider the root (L0) package as a PyDep.
+			if module_name == nrm_name(package['name']):  # pyright: ignore[reportAny]
+				if root_package is None:
+					root_package = package  # pyright: ignore[reportAny]
+				continue
+
+			if not (
+				# Package must have a version.
+				'version' in package
+				# Package must have a registry URL.
+				and 'source' in package
+				and 'registry' in package['source']
+			):
+				continue
+
+			registry: str = package['source']['registry']  # pyright: ignore[reportAny]
+
+			# Parse Dependencies w/Markers
+			deps: dict[str, PyDepMarker | None] = {}
+			for dependency in itertools.chain(  # pyright: ignore[reportAny]
+				# Always include mandatory dependencies.
+				package.get('dependencies', ()),  # pyright: ignore[reportAny]
+				# Always include "all" optional dependencies.
+				## - uv has already worked out which optional deps are needed.
+				## - Unused [optional-dependencies] simply aren't in uv.lock.
+				## - So, it's safe to pretend that they are all normal dependencies.
+				itertools.chain.from_iterable(
+					package.get('optional-dependencies', {}).values()  # pyright: ignore[reportAny]
+				),
+			):
+				marker_str: str | None = dependency.get('marker')  # pyright: ignore[reportAny]
+				deps[dependency['name']] = (  # pyright: ignore[reportAny]
+					pydep_marker(marker_str) if marker_str is not None else None
 				)
-			}
-			pydeps = {(pydep.name, pydep.version_string): pydep for pydep in pydeps_set}
+
+			pydep = PyDep(
+				name=package['name'],  # pyright: ignore[reportAny]
+				version_string=package['version'],  # pyright: ignore[reportAny]
+				registry=registry,
+				wheels=frozenset({
+					PyDepWheel(
+						url=wheel_info['url'],  # pyright: ignore[reportAny]
+						registry=registry,
+						hash=wheel_info.get('hash'),  # pyright: ignore[reportAny]
+						size=wheel_info.get('size'),  # pyright: ignore[reportAny]
+					)
+					for wheel_info in package.get('wheels', ())  # pyright: ignore[reportAny]
+					if 'url' in wheel_info
+				}),
+				deps=frozendict(deps),
+			)
+
+			## NOTE: Node names and versions are interned.
+			## - Graph walks hash and compare these tuples constantly.
+			## - Interned strings compare by identity, and share their cached hash.
+			pydeps[(sys.intern(pydep.name), sys.intern(pydep.version_string))] = pydep
 
 		####################
 		# - Stage 2: Parse Target (L1) Dependencies
@@ -425,7 +654,7 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 			## - Always found in 'manifest.requirements'.
 			if 'requirements' in uv_lock['manifest']:
 				target_pydeps = {
-					packaging.utils.canonicalize_name(
+					nrm_name(
 						dependency['name']  ## pyright: ignore[reportAny]
 					): None
 					for dependency in uv_lock['manifest']['requirements']  # pyright: ignore[reportAny]
@@ -436,13 +665,11 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 
 		# Projects: Find L1 Deps from the L0 Dep (the root package == the blext project)
 		elif 'package' in uv_lock:
-			# Find the Root Package
-			root_package: dict[str, typ.Any] = next(
-				package
-				for package in uv_lock['package']  # pyright: ignore[reportAny]
-				if 'name' in package
-				and module_name == packaging.utils.canonicalize_name(package['name'])  # pyright: ignore[reportAny]
-			)
+			# Check the Root Package
+			## - It was already found while parsing [[package]].
+			if root_package is None:
+				msg = f'`uv.lock` has a `[[package]]` list, but no package named `{module_name}`. Was it generated correctly?'
+				raise RuntimeError(msg)
 
 			# Parse Target Dependencies
 			## - Always found in root_package['metadata']['requires-dist'].
@@ -452,8 +679,8 @@ class BLExtDeps(pyd.BaseModel, frozen=True):
 				and 'requires-dist' in root_package['metadata']
 			):
 				target_pydeps = {
-					packaging.utils.canonicalize_name(dependency['name']): PyDepMarker(  # pyright: ignore[reportAny]
-						marker_str=dependency['marker']  # pyright: ignore[reportAny]
+					nrm_name(dependency['name']): pydep_marker(  # pyright: ignore[reportAny]
+						dependency['marker']  # pyright: ignore[reportAny]
 					)
 					if 'marker' in dependency
 					else None
@@ -17,6 +17,7 @@
 """Implements `PyDep` and `PyDepMarker."""
 
 import functools
+import operator
 import re
 import typing as typ
 
@@ -39,9 +40,26 @@ from .pydep_wheel import PyDepWheel
 ####################
 _EMPTY_FROZENSET_STR = frozenset[str]()
 
-RE_PYDEP_NAME = re.compile(r'^([A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9])$', re.IGNORECASE)
+## - Which `PyDepWheel` sort key to prefer wheels by, on each `BLPlatform`.
+_SORT_KEY_PREFERRED_BY_PLATFORM: frozendict[
+	extyp.BLPlatform, typ.Callable[[PyDepWheel], typ.Any]
+] = frozendict({
+	extyp.BLPlatform.linux_x64: operator.attrgetter('sort_key_preferred_linux'),
+	extyp.BLPlatform.linux_arm64: operator.attrgetter('sort_key_preferred_linux'),
+	extyp.BLPlatform.macos_x64: operator.attrgetter('sort_key_preferred_mac'),
+	extyp.BLPlatform.macos_arm64: operator.attrgetter('sort_key_preferred_mac'),
+	extyp.BLPlatform.windows_x64: operator.attrgetter('sort_key_preferred_windows'),
+	extyp.BLPlatform.windows_arm64: operator.attrgetter('sort_key_preferred_windows'),
+})
+
+## NOTE: Both are ASCII-only, so the regex engine can skip Unicode case-folding.
+## - `\Z` is used instead of `$`, since `$` also matches right before a trailing newline.
+RE_PYDEP_NAME = re.compile(
+	r'^([A-Z0-9]|[A-Z0-9][A-Z0-9._-]*[A-Z0-9])\Z', re.IGNORECASE | re.ASCII
+)
 RE_PYDEP_VERSION = re.compile(
-	r'^([1-9][0-9]*!)?(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*((a|b|rc)(0|[1-9][0-9]*))?(\.post(0|[1-9][0-9]*))?(\.dev(0|[1-9][0-9]*))?$'
+	r'^([1-9][0-9]*!)?(0|[1-9][0-9]*)(\.(0|[1-9][0-9]*))*((a|b|rc)(0|[1-9][0-9]*))?(\.post(0|[1-9][0-9]*))?(\.dev(0|[1-9][0-9]*))?\Z',
+	re.ASCII,
 )
 
 
@@ -55,6 +73,17 @@ def match_pydep_version_regex(name: str) -> bool:
 	return RE_PYDEP_VERSION.match(name) is not None
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_pydep_version(version_string: str) -> packaging.version.Version:
+	"""Parse a `PyDep` version string, at most once per unique version string.
+
+	Notes:
+		Many `PyDep`s share version strings, such as `1.0.0`.
+		They then also share one immutable `packaging.version.Version`.
+	"""
+	return packaging.version.Version(version_string)
+
+
 ####################
 # - Class
 ####################
@@ -95,7 +124,7 @@ class PyDep(pyd.BaseModel, frozen=True):
 	@functools.cached_property
 	def version(self) -> packaging.version.Version:
 		"""Standardized `packging.version.Version`, derived from `self.version_string`."""
-		return packaging.version.Version(self.version_string)
+		return parse_pydep_version(self.version_string)
 
 	####################
 	# - Wheel Selection
@@ -178,13 +207,19 @@ class PyDep(pyd.BaseModel, frozen=True):
 			**Any wheel** returned by this method will work in the given Python environment.
 			In general, however, it's best to select the wheel with the largest `glibc` / `macos` version, as this is likely to provide the widest and/or most expected feature set for the user.
 		"""
+		semivalid_wheels = self.semivalid_wheels_for(
+			bl_platform=bl_platform,
+			valid_python_tags=valid_python_tags,
+			valid_abi_tags=valid_abi_tags,
+		)
+
+		# Windows has no OS version constraint, so all semivalid wheels are valid.
+		if bl_platform.is_windows:
+			return semivalid_wheels
+
 		return frozenset(
 			wheel
-			for wheel in self.semivalid_wheels_for(
-				bl_platform=bl_platform,
-				valid_python_tags=valid_python_tags,
-				valid_abi_tags=valid_abi_tags,
-			)
+			for wheel in semivalid_wheels
 			# The wheel must work for the constrained OS version of the given BLPlatform.
 			if wheel.works_with_bl_platform(
 				bl_platform=bl_platform,
@@ -193,6 +228,49 @@ class PyDep(pyd.BaseModel, frozen=True):
 			)
 		)
 
+	@lru_method()
+	def preferred_wheel_for(
+		self,
+		*,
+		bl_platform: extyp.BLPlatform,
+		valid_python_tags: frozenset[str],
+		valid_abi_tags: frozenset[str],
+		min_glibc_version: semver.version.Version,
+		min_macos_version: semver.version.Version,
+	) -> PyDepWheel | None:
+		"""Select the "best" wheel from `self.valid_wheels_for(...)`, if there are any.
+
+		Notes:
+			Unlike `self.select_wheel()`, this doesn't explain why no wheel could be found.
+			Therefore, it only depends on the target environment, and can be memoized.
+
+		Parameters:
+			bl_platform: The target environment's Blender platform.
+			valid_python_tags: The supported Python interpreter tags of the target environment.
+			valid_abi_tags: The supported Python ABI tags of the target environment.
+			min_glibc_version: The minimum `glibc` version of the target environment.
+				_Ignored if the target environment is not Linux-based._
+			min_macos_version: The minimum `macos` version of the target environment.
+				_Ignored if the target environment is not MacOS-based._
+
+		Returns:
+			The preferred valid wheel, or `None` if there are no valid wheels.
+		"""
+		valid_wheels = self.valid_wheels_for(
+			bl_platform=bl_platform,
+			valid_python_tags=valid_python_tags,
+			valid_abi_tags=valid_abi_tags,
+			min_glibc_version=min_glibc_version,
+			min_macos_version=min_macos_version,
+		)
+		if not valid_wheels:
+			return None
+
+		## - Prefer some wheels over others in a platform-specific manner.
+		## - For instance, one might want to prefer higher `glibc` versions when available.
+		## - Only the first wheel in sorted order is needed, so there's no need to sort all of them.
+		return min(valid_wheels, key=_SORT_KEY_PREFERRED_BY_PLATFORM[bl_platform])
+
 	def select_wheel(  # noqa: PLR0913
 		self,
 		*,
@@ -207,7 +285,7 @@ class PyDep(pyd.BaseModel, frozen=True):
 		"""Select the "best" wheel to implement this `PyDep` in a given Python environment.
 
 		Notes:
-			This method essentially selects the "best" wheel from `self.valid_wheels_for(...)`.
+			This method essentially selects the "best" wheel from `self.valid_wheels_for(...)`, using `self.preferred_wheel_for(...)`.
 
 			In this context, "best" means "highest OS version" (`min_glibc_version` or `min_macos_version`), since this maximizes the feature available to the user.
 
@@ -236,35 +314,28 @@ class PyDep(pyd.BaseModel, frozen=True):
 			In general, however, it's best to select the wheel with the largest `glibc` / `macos` version, as this is likely to provide the widest and/or most expected feature set for the user.
 		"""
 		####################
-		# - Step 0: Find All Valid Wheels
+		# - Step 1: Select "Best" Wheel
 		####################
-		semivalid_wheels = self.semivalid_wheels_for(
-			bl_platform=bl_platform,
-			valid_python_tags=valid_python_tags,
-			valid_abi_tags=valid_abi_tags,
-		)
-		valid_wheels = self.valid_wheels_for(
+		preferred_wheel = self.preferred_wheel_for(
 			bl_platform=bl_platform,
 			valid_python_tags=valid_python_tags,
 			valid_abi_tags=valid_abi_tags,
 			min_glibc_version=min_glibc_version,
 			min_macos_version=min_macos_version,
 		)
+		if preferred_wheel is not None:
+			return preferred_wheel
 
 		####################
-		# - Step 1: Select "Best" Wheel
+		# - Step 2: Explain Why No Wheel Was Found
 		####################
-		## - Prefer some wheels over others in a platform-specific manner.
-		## - For instance, one might want to prefer higher `glibc` versions when available.
+		semivalid_wheels = self.semivalid_wheels_for(
+			bl_platform=bl_platform,
+			valid_python_tags=valid_python_tags,
+			valid_abi_tags=valid_abi_tags,
+		)
 		match bl_platform:
 			case extyp.BLPlatform.linux_x64 | extyp.BLPlatform.linux_arm64:
-				if valid_wheels:
-					return sorted(
-						valid_wheels,
-						key=lambda wheel: wheel.sort_key_preferred_linux,
-					)[0]
-
-				## Error Handling
 				osver_str = 'glibc'
 				min_osver_str = f'{min_glibc_version.major}.{min_glibc_version.minor}'
 				semivalid_wheel_osver_strs = {
@@ -275,16 +346,8 @@ class PyDep(pyd.BaseModel, frozen=True):
 					)
 					for semivalid_wheel in semivalid_wheels
 				}
-				##
 
 			case extyp.BLPlatform.macos_x64 | extyp.BLPlatform.macos_arm64:
-				if valid_wheels:
-					return sorted(
-						valid_wheels,
-						key=lambda wheel: wheel.sort_key_preferred_mac,
-					)[0]
-
-				## Error Handling
 				osver_str = 'macos'
 				min_osver_str = f'{min_macos_version.major}.{min_macos_version.minor}'
 				semivalid_wheel_osver_strs = {
@@ -295,17 +358,11 @@ class PyDep(pyd.BaseModel, frozen=True):
 					)
 					for semivalid_wheel in semivalid_wheels
 				}
-				##
 
 			case extyp.BLPlatform.windows_x64 | extyp.BLPlatform.windows_arm64:
-				if valid_wheels:
-					return sorted(
-						valid_wheels,
-						key=lambda wheel: wheel.sort_key_preferred_windows,
-					)[0]
-
 				## The error assembly must not use osver_str for windows.
 				## Trust the process. Or contribute a pull request ;)
+				pass
 
 		# Collect Errors w/Explanation and Remedies
 		errors = [
@@ -421,7 +478,7 @@ class PyDep(pyd.BaseModel, frozen=True):
 			- `packaging.utils`: <https://packaging.pypa.io/en/stable/utils.html#packaging.utils.canonicalize_version>
 		"""
 		normalized_deps = dict[str, PyDepMarker | None]()
-		for dep_name, dep_marker in deps.copy().items():
+		for dep_name, dep_marker in deps.items():
 			try:
 				normalized_deps[
 					packaging.utils.canonicalize_name(dep_name, validate=True)
@@ -17,8 +17,11 @@
 """Tools for managing wheel-based dependencies."""
 
 import concurrent.futures
-import functools
+import hashlib
+import itertools
+import os
 import sys
+import threading
 import typing as typ
 import urllib.error
 import urllib.request
@@ -26,27 +29,67 @@ from pathlib import Path
 
 from .pydep_wheel import PyDepWheel
 
-if typ.TYPE_CHECKING:
-	import collections.abc as cabc
+####################
+# - Constants
+####################
+## Downloads are I/O-bound, but every thread still costs a stack and a connection.
+## - Past a few dozen concurrent downloads, servers tend to throttle or reset connections.
+DOWNLOAD_THREADS = 32
+DOWNLOAD_CHUNK_BYTES = 2**20
+
+## Hashing is CPU-bound, but `hashlib` releases the GIL while digesting large chunks.
+HASH_THREADS = os.cpu_count() or 1
 
 
 ####################
-# - Constants
+# - PyDepWheel Validation
 ####################
-DOWNLOAD_THREADS = 32768
-DOWNLOAD_CHUNK_BYTES = 32768
+def downloaded_wheels(
+	wheels: frozenset[PyDepWheel],
+	*,
+	path_wheels: Path,
+	max_hash_threads: int = HASH_THREADS,
+) -> frozenset[PyDepWheel]:
+	"""Find the wheels that have already been correctly downloaded to a folder.
 
-SIGNAL_ABORT: bool = False
+	Notes:
+		Wheels are hashed in parallel, since `hashlib` doesn't hold the GIL while digesting file data.
+
+	Parameters:
+		wheels: Wheels to look for.
+		path_wheels: Folder that the wheels would have been downloaded to.
+		max_hash_threads: Maximum number of wheels to hash at the same time.
+			No more threads are used than there are wheels to hash.
+
+	Returns:
+		The wheels whose file exists in `path_wheels`, with the expected hash.
+	"""
+	if not wheels:
+		return frozenset()
+
+	wheels_to_check = tuple(wheels)
+	with concurrent.futures.ThreadPoolExecutor(
+		max_workers=min(max_hash_threads, len(wheels_to_check))
+	) as pool:
+		is_wheel_downloaded = pool.map(
+			lambda wheel: wheel.is_download_valid(path_wheels / wheel.filename),
+			wheels_to_check,
+		)
+		return frozenset(itertools.compress(wheels_to_check, is_wheel_downloaded))
 
 
 ####################
 # - PyDepWheel Download
 ####################
-def download_wheel(
+def download_wheel(  # noqa: PLR0913
 	wheel_url: str,
 	wheel_path: Path,
 	*,
 	wheel: PyDepWheel,
+	abort_download: threading.Event | None = None,
+	cb_start_wheel_download: typ.Callable[
+		[PyDepWheel, Path], list[None] | None
+	] = lambda *_: None,  # pyright: ignore[reportUnknownLambdaType]
 	cb_update_wheel_download: typ.Callable[
 		[PyDepWheel, Path, int], list[None] | None
 	] = lambda *_: None,  # pyright: ignore[reportUnknownLambdaType]
@@ -59,33 +102,38 @@ def download_wheel(
 	Notes:
 		This function is designed to be run in a background thread.
 
+		Data is read into one reused buffer of `DOWNLOAD_CHUNK_BYTES`, instead of allocating new `bytes` per chunk.
+		The wheel is hashed as it is downloaded, so it never needs to be read back from disk to be validated.
+
 	Parameters:
 		wheel_url: URL to download the wheel from.
 		wheel_path: Path to download the wheel to.
 		wheel: The wheel spec to be downloaded.
+		abort_download: When set, the download is stopped and the partial wheel is deleted.
+			Checked once per downloaded chunk.
+		cb_start_wheel_download: Callback to trigger when the download actually starts.
 		cb_update_wheel_download: Callback to trigger whenever more data has been downloaded.
 		cb_finish_wheel_download: Callback to trigger whenever a wheel has finished downloading.
 	"""
+	_ = cb_start_wheel_download(wheel, wheel_path)
 	with (
 		urllib.request.urlopen(wheel_url, timeout=10) as www_wheel,  # pyright: ignore[reportAny]
 		wheel_path.open('wb') as f_wheel,
 	):
-		raw_data_iterator: cabc.Iterator[bytes] = iter(
-			functools.partial(
-				www_wheel.read,  # pyright: ignore[reportAny]
-				DOWNLOAD_CHUNK_BYTES,
-			),
-			b'',
-		)
-		for raw_data in raw_data_iterator:
-			if SIGNAL_ABORT:
+		wheel_digest = hashlib.sha256()
+		raw_data = bytearray(DOWNLOAD_CHUNK_BYTES)
+		raw_data_view = memoryview(raw_data)
+		while (num_bytes := www_wheel.readinto(raw_data)) > 0:  # pyright: ignore[reportAny]
+			if abort_download is not None and abort_download.is_set():
 				wheel_path.unlink()
 				return
 
-			_ = f_wheel.write(raw_data)
-			_ = cb_update_wheel_download(wheel, wheel_path, len(raw_data))
+			raw_data_chunk = raw_data_view[:num_bytes]
+			wheel_digest.update(raw_data_chunk)
+			_ = f_wheel.write(raw_data_chunk)
+			_ = cb_update_wheel_download(wheel, wheel_path, num_bytes)
 
-	if not wheel.is_download_valid(wheel_path):
+	if not wheel.is_digest_valid(wheel_digest.hexdigest()):
 		wheel_path.unlink()
 		msg = f'Hash of downloaded wheel at path {wheel_path} did not match expected hash: {wheel.hash}'
 		raise ValueError(msg)
@@ -97,6 +145,7 @@ def download_wheels(
 	wheels: frozenset[PyDepWheel],
 	*,
 	path_wheels: Path,
+	max_download_threads: int = DOWNLOAD_THREADS,
 	cb_start_wheel_download: typ.Callable[
 		[PyDepWheel, Path], typ.Any
 	] = lambda *_: None,  # pyright: ignore[reportUnknownLambdaType]
@@ -122,69 +171,100 @@ def download_wheels(
 	Parameters:
 		wheels: Wheels to download.
 		path_wheels: Folder within which to download wheels to.
+		max_download_threads: Maximum number of wheels to download at the same time.
+			No more threads are used than there are wheels to download.
 		cb_start_wheel_download: Callback to trigger when starting a wheel download.
 		cb_update_wheel_download: Callback to trigger when a wheel download should update.
 		cb_finish_wheel_download: Callback to trigger when a wheel download has finished.
 	"""
-	global SIGNAL_ABORT  # noqa: PLW0603
-
 	path_wheels = path_wheels.resolve()
-	wheel_paths_current = frozenset({
-		path_wheel.resolve() for path_wheel in path_wheels.rglob('*.whl')
-	})
+
+	# Find Current Wheels by Filename
+	## - Wheels are only ever downloaded directly into `path_wheels`.
+	## - So, there's no need to walk subfolders, or to resolve each path.
+	## - `os.scandir` also avoids making a `Path` per directory entry.
+	wheel_filenames_current: frozenset[str] = frozenset()
+	if path_wheels.is_dir():
+		with os.scandir(path_wheels) as dir_entries:
+			wheel_filenames_current = frozenset({
+				dir_entry.name
+				for dir_entry in dir_entries
+				if dir_entry.name.endswith('.whl') and dir_entry.is_file()
+			})
+
+	# Check Hash of Current Wheels
+	## - Only wheels whose filename already exists need to be hashed.
+	wheels_current = downloaded_wheels(
+		frozenset({
+			wheel for wheel in wheels if wheel.filename in wheel_filenames_current
+		}),
+		path_wheels=path_wheels,
+	)
 
 	# Compute PyDepWheels to Download
 	## - Missing: Will be downloaded.
-	## - Superfluous: Will be deleted.
+	## - Invalid: Will be downloaded again, overwriting the existing file.
 	wheels_to_download = {
 		path_wheels / wheel.filename: wheel
 		for wheel in wheels
-		if path_wheels / wheel.filename not in wheel_paths_current
+		if wheel not in wheels_current
 	}
 
 	# Download Missing PyDepWheels
 	if wheels_to_download:
+		## - Setting `abort_download` stops all running downloads, at their next chunk.
+		## - Downloads are only "started" once a thread picks them up, so queued wheels don't show up as stalled.
+		abort_download = threading.Event()
 		with concurrent.futures.ThreadPoolExecutor(
-			max_workers=DOWNLOAD_THREADS
+			max_workers=min(max_download_threads, len(wheels_to_download))
 		) as pool:
 			futures: set[concurrent.futures.Future[None]] = set()
 			for path_wheel, wheel in sorted(
 				wheels_to_download.items(),
 				key=lambda el: el[1].filename,
 			):
-				cb_start_wheel_download(wheel, path_wheel)
 				futures.add(
 					pool.submit(
 						download_wheel,
 						str(wheel.url),
 						path_wheel,
 						wheel=wheel,
+						abort_download=abort_download,
+						cb_start_wheel_download=cb_start_wheel_download,
 						cb_update_wheel_download=cb_update_wheel_download,
 						cb_finish_wheel_download=cb_finish_wheel_download,
 					)
 				)
 
+			# Wait for All Downloads
+			## - Returns early when any download fails.
 			try:
-				for future in concurrent.futures.as_completed(futures):
-					try:
-						future.result()
-					except (
-						urllib.error.URLError,
-						urllib.error.HTTPError,
-						urllib.error.ContentTooShortError,
-					) as ex:
-						SIGNAL_ABORT = True  # pyright: ignore[reportConstantRedefinition]
-						pool.shutdown(wait=True, cancel_futures=True)
-
-						SIGNAL_ABORT = False  # pyright: ignore[reportConstantRedefinition]
-						msg = (
-							'A wheel download aborted with the following message: {ex}'
-						)
-						raise ValueError(msg) from ex
-
+				futures_done, _ = concurrent.futures.wait(
+					futures, return_when=concurrent.futures.FIRST_EXCEPTION
+				)
 			except KeyboardInterrupt:
-				SIGNAL_ABORT = True  # pyright: ignore[reportConstantRedefinition]
+				abort_download.set()
 				pool.shutdown(wait=True, cancel_futures=True)
 
-				SIGNAL_ABORT = False  # pyright: ignore[reportConstantRedefinition]
 				sys.exit(1)
+
+			# Abort All Downloads on Failure
+			for future in futures_done:
+				ex = future.exception()
+				if ex is not None:
+					abort_download.set()
+					pool.shutdown(wait=True, cancel_futures=True)
+
+					if isinstance(
+						ex,
+						(
+							urllib.error.URLError,
+							urllib.error.HTTPError,
+							urllib.error.ContentTooShortError,
+						),
+					):
+						msg = (
+							f'A wheel download aborted with the following message: {ex}'
+						)
+						raise ValueError(msg) from ex
+					raise ex
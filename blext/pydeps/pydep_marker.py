@@ -23,6 +23,7 @@ import packaging.markers
 import pydantic as pyd
 
 from blext import extyp
+from blext.utils.lru_method import lru_method
 
 
 class PyDepMarker(pyd.BaseModel, frozen=True):
@@ -45,6 +46,7 @@ class PyDepMarker(pyd.BaseModel, frozen=True):
 	####################
 	# - Methods
 	####################
+	@lru_method()
 	def is_valid_for(
 		self,
 		*,
@@ -62,6 +64,8 @@ class PyDepMarker(pyd.BaseModel, frozen=True):
 
 			Presumably, this prevents name-conflicts.
 
+			Memoized, since the same marker is typically checked against the same environment many times while walking the dependency graph.
+
 		Parameters:
 			pkg_name: The name of the root package, defined with standard `_`.
 				- Used for the package-encoded version of the extras.
@@ -451,6 +451,14 @@ class PyDepWheel(pyd.BaseModel, frozen=True):
 		"""
 		return len(valid_abi_tags & self.abi_tags) > 0
 
+	def is_digest_valid(self, sha256_hexdigest: str) -> bool:
+		"""Check whether a `sha256` digest of some data matches the expected hash of this wheel.
+
+		Parameters:
+			sha256_hexdigest: The hex-encoded `sha256` digest of the data to check.
+		"""
+		return 'sha256:' + sha256_hexdigest == self.hash
+
 	def is_download_valid(self, wheel_path: Path) -> bool:
 		"""Check whether a downloaded file is, in fact, this wheel.
 
@@ -464,7 +472,7 @@ class PyDepWheel(pyd.BaseModel, frozen=True):
 			with wheel_path.open('rb', buffering=0) as f:
 				file_digest = hashlib.file_digest(f, 'sha256').hexdigest()
 
-			return 'sha256:' + file_digest == self.hash
+			return self.is_digest_valid(file_digest)
 		return False
 
 	####################
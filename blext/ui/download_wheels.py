@@ -24,8 +24,6 @@ from pathlib import Path
 
 import pydantic as pyd
 import rich.console
-import rich.live
-import rich.progress
 import rich.table
 
 from blext import pydeps
@@ -86,6 +84,10 @@ def ui_download_wheels(
 	See Also:
 		`blext.ui.download_wheels.CallbacksDownloadWheel`: For more on when to call each callback.
 	"""
+	## Only imported once wheels are actually downloaded, to keep `blext build` imports light.
+	import rich.live  # noqa: PLC0415
+	import rich.progress  # noqa: PLC0415
+
 	bytes_to_download = sum(int(wheel.size) for wheel in wheels_to_download)
 
 	####################
@@ -24,11 +24,12 @@ from pathlib import Path
 
 import pydantic as pyd
 import rich.console
-import rich.live
-import rich.progress
 import rich.table
 from frozendict import frozendict
 
+if typ.TYPE_CHECKING:
+	import rich.live  # noqa: TC004
+
 
 ####################
 # - Structs
@@ -42,7 +43,7 @@ class PrepackCallback(typ.Protocol):
 		path: Path,
 		zipfile_path: Path,
 		*,
-		live: rich.live.Live,
+		live: 'rich.live.Live',
 	) -> typ.Any:
 		"""Signature of the callback."""
 
@@ -96,6 +97,10 @@ def ui_prepack_extension(
 	See Also:
 		`blext.ui.download_wheels.CallbacksDownloadWheel`: For more on when to call each callback.
 	"""
+	## Only imported once an extension is actually prepacked, to keep `blext build` imports light.
+	import rich.live  # noqa: PLC0415
+	import rich.progress  # noqa: PLC0415
+
 	file_sizes = {path: path.stat().st_size for path in files_to_prepack}
 	bytes_to_prepack = sum(file_size for file_size in file_sizes.values())
 
@@ -129,7 +134,7 @@ def ui_prepack_extension(
 		path: Path,
 		_: Path,
 		*,
-		live: rich.live.Live,
+		live: 'rich.live.Live',
 	) -> None:
 		progress_prepack.advance(
 			task_prepack,
@@ -15,3 +15,179 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """Tests `blext.pack`."""
+
+import os
+import zipfile
+import zlib
+from pathlib import Path
+
+import pytest
+
+from blext import pack
+
+
+####################
+# - Helpers
+####################
+def _write_files(path_root: Path, contents: dict[str, bytes]) -> dict[Path, Path]:
+	files_to_prepack: dict[Path, Path] = {}
+	for filename, content in contents.items():
+		path_file = path_root / filename
+		_ = path_file.write_bytes(content)
+		files_to_prepack[path_file] = Path('wheels') / filename
+
+	return files_to_prepack
+
+
+####################
+# - Tests: Pre-Pack
+####################
+def test_prepacked_files_are_reused(tmp_path: Path) -> None:
+	"""Test that unchanged pre-packed files don't need to be pre-packed again."""
+	files_to_prepack = _write_files(tmp_path, {'a.whl': b'a' * 64, 'b.whl': b'b'})
+	path_zip_prepack = tmp_path / 'prepack.zip'
+
+	pack.prepack_extension(files_to_prepack, path_zip_prepack=path_zip_prepack)
+
+	assert pack.existing_prepacked_files(
+		files_to_prepack, path_zip_prepack=path_zip_prepack
+	) == frozenset(files_to_prepack.values())
+
+
+def test_large_prepacked_files_round_trip(tmp_path: Path) -> None:
+	"""Test that files read in several chunks are pre-packed like `ZipFile.write` would."""
+	content = b''.join(
+		os.urandom(64) * (pack.ZIP_CHUNK_BYTES // 256) for _ in range(10)
+	)
+	assert len(content) > 2 * pack.ZIP_CHUNK_BYTES
+	files_to_prepack = _write_files(tmp_path, {'a.whl': content})
+	path_zip_prepack = tmp_path / 'prepack.zip'
+	path_zip_write = tmp_path / 'write.zip'
+
+	pack.prepack_extension(files_to_prepack, path_zip_prepack=path_zip_prepack)
+	with zipfile.ZipFile(
+		path_zip_write,
+		'w',
+		compression=zipfile.ZIP_DEFLATED,
+		compresslevel=pack.ZIP_COMPRESSLEVEL,
+	) as f_zip:
+		f_zip.write(tmp_path / 'a.whl', 'wheels/a.whl')
+
+	with (
+		zipfile.ZipFile(path_zip_prepack, 'r') as f_zip_prepack,
+		zipfile.ZipFile(path_zip_write, 'r') as f_zip_write,
+	):
+		zip_info_prepack = f_zip_prepack.getinfo('wheels/a.whl')
+		zip_info_write = f_zip_write.getinfo('wheels/a.whl')
+
+		assert f_zip_prepack.read(zip_info_prepack) == content
+		assert zlib.crc32(content) == zip_info_prepack.CRC
+		assert zip_info_prepack.compress_size == zip_info_write.compress_size
+
+
+def test_stale_prepacked_files_are_repacked(tmp_path: Path) -> None:
+	"""Test that modifying a pre-packed host file invalidates the pre-packed zipfile."""
+	files_to_prepack = _write_files(tmp_path, {'a.whl': b'a' * 64, 'b.whl': b'b'})
+	path_zip_prepack = tmp_path / 'prepack.zip'
+
+	pack.prepack_extension(files_to_prepack, path_zip_prepack=path_zip_prepack)
+
+	path_stale = tmp_path / 'b.whl'
+	_ = path_stale.write_bytes(b'bb')
+	os.utime(path_stale, ns=(0, 0))
+
+	assert (
+		pack.existing_prepacked_files(
+			files_to_prepack, path_zip_prepack=path_zip_prepack
+		)
+		== frozenset()
+	)
+	assert not path_zip_prepack.exists()
+	assert not pack.path_prepack_manifest(path_zip_prepack).exists()
+
+
+def test_superfluous_prepacked_files_are_repacked(tmp_path: Path) -> None:
+	"""Test that no longer needed pre-packed files invalidate the pre-packed zipfile."""
+	files_to_prepack = _write_files(tmp_path, {'a.whl': b'a' * 64, 'b.whl': b'b'})
+	path_zip_prepack = tmp_path / 'prepack.zip'
+
+	pack.prepack_extension(files_to_prepack, path_zip_prepack=path_zip_prepack)
+
+	del files_to_prepack[tmp_path / 'b.whl']
+	assert (
+		pack.existing_prepacked_files(
+			files_to_prepack, path_zip_prepack=path_zip_prepack
+		)
+		== frozenset()
+	)
+
+
+def test_prepacked_files_with_other_compression_are_repacked(tmp_path: Path) -> None:
+	"""Test that changing the compression method invalidates the pre-packed zipfile."""
+	files_to_prepack = _write_files(tmp_path, {'a.whl': b'a' * 64, 'b.whl': b'b'})
+	path_zip_prepack = tmp_path / 'prepack.zip'
+
+	pack.prepack_extension(
+		files_to_prepack, path_zip_prepack=path_zip_prepack, compression='deflate'
+	)
+
+	assert (
+		pack.existing_prepacked_files(
+			files_to_prepack, path_zip_prepack=path_zip_prepack, compression='lzma'
+		)
+		== frozenset()
+	)
+
+
+####################
+# - Tests: Pack
+####################
+@pytest.mark.parametrize('deflate_zlib_name', ['zlib', 'zlib_ng.zlib_ng'])
+def test_packed_files_round_trip(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch, deflate_zlib_name: str
+) -> None:
+	"""Test that files packed in parallel, or streamed, can be read back unchanged."""
+	## - 'zlib_ng' is optional; its case is skipped when it isn't installed.
+	monkeypatch.setattr(pack, 'DEFLATE_ZLIB', pytest.importorskip(deflate_zlib_name))
+
+	path_root = tmp_path / 'src'
+	(path_root / 'pkg').mkdir(parents=True)
+	contents = {
+		**{f'mod_{i}.py': f'VALUE = {i}\n'.encode() * (i + 1) for i in range(12)},
+		'pkg/__init__.py': b'',
+		'pkg/data.bin': os.urandom(pack.ZIP_PARALLEL_MAX_BYTES + 1),
+	}
+	for filename, content in contents.items():
+		_ = (path_root / filename).write_bytes(content)
+
+	path_zip = tmp_path / 'packed.zip'
+	with zipfile.ZipFile(
+		path_zip, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6
+	) as f_zip:
+		pack.pack_files(
+			f_zip,
+			sorted(str(path_root / filename) for filename in contents),
+			path_root=path_root,
+			max_workers=2,
+		)
+
+	with zipfile.ZipFile(path_zip, 'r') as f_zip:
+		assert f_zip.testzip() is None
+		assert {
+			zip_info.filename: f_zip.read(zip_info) for zip_info in f_zip.infolist()
+		} == contents
+
+
+def test_pack_files_refuses_open_write_handle(tmp_path: Path) -> None:
+	"""Test that files aren't packed while another file is being written to the zipfile."""
+	path_file = tmp_path / 'mod.py'
+	_ = path_file.write_bytes(b'VALUE = 1\n')
+
+	with (
+		zipfile.ZipFile(
+			tmp_path / 'packed.zip', 'w', compression=zipfile.ZIP_DEFLATED
+		) as f_zip,
+		f_zip.open('other.py', 'w'),
+		pytest.raises(ValueError, match='write handle'),
+	):
+		pack.pack_files(f_zip, [str(path_file)], path_root=tmp_path)
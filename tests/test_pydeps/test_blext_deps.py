@@ -15,3 +15,293 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """Tests `blext.pydeps.blext_deps`."""
+
+import random
+import typing as typ
+
+import networkx as nx
+import pytest
+from frozendict import frozendict
+
+from blext import extyp, pydeps
+
+####################
+# - Constants
+####################
+BL_VERSION = extyp.BLReleaseOfficial.BL4_2_0.bl_version
+VENDORED_PYDEP_NAME = 'numpy'
+PYDEP_MARKER_STRS = (
+	None,
+	"sys_platform == 'win32'",
+	"sys_platform == 'linux'",
+	"platform_machine == 'arm64'",
+	"python_version < '3.8'",
+)
+
+
+####################
+# - Helpers
+####################
+def _uv_lock(
+	packages: dict[str, list[tuple[str, str | None]]],
+	*,
+	targets: list[tuple[str, str | None]],
+	names_without_wheels: frozenset[str] = frozenset(),
+) -> frozendict[str, typ.Any]:
+	"""Make a parsed `uv.lock` of a project named `root`, where every package has a universal wheel.
+
+	Parameters:
+		packages: Each package name, mapped to its `(dependency name, marker)`s.
+		targets: The `(dependency name, marker)`s of the `root` project.
+		names_without_wheels: Packages that should have no wheels at all.
+	"""
+
+	def dependencies(deps: list[tuple[str, str | None]]) -> list[dict[str, str]]:
+		return [
+			{'name': dep_name}
+			if marker_str is None
+			else {'name': dep_name, 'marker': marker_str}
+			for dep_name, marker_str in deps
+		]
+
+	return frozendict({
+		'package': [
+			*[
+				{
+					'name': name,
+					'version': '1.0',
+					'source': {'registry': 'https://pypi.org/simple'},
+					'dependencies': dependencies(deps),
+					'wheels': []
+					if name in names_without_wheels
+					else [
+						{
+							'url': f'https://files.pythonhosted.org/packages/{name}-1.0-py3-none-any.whl',
+							'hash': 'sha256:' + '0' * 64,
+							'size': 1,
+						}
+					],
+				}
+				for name, deps in packages.items()
+			],
+			{
+				'name': 'root',
+				'version': '0.1.0',
+				'source': {'editable': '.'},
+				'metadata': {'requires-dist': dependencies(targets)},
+			},
+		]
+	})
+
+
+def _pydep_names_by(
+	deps: pydeps.BLExtDeps, bl_platform: extyp.BLPlatform
+) -> frozenset[str]:
+	return frozenset(
+		deps.pydeps_by(pkg_name='root', bl_version=BL_VERSION, bl_platform=bl_platform)
+	)
+
+
+def _random_uv_lock(seed: int, *, acyclic: bool) -> frozendict[str, typ.Any]:
+	"""Make a `uv.lock` with random, marker-gated dependencies.
+
+	Parameters:
+		seed: Seed of the random dependencies.
+		acyclic: Whether packages may only depend on packages later in the list.
+			Otherwise, the dependencies are very likely to contain cycles.
+	"""
+	rng = random.Random(seed)
+	names = [VENDORED_PYDEP_NAME] + [f'pkg-{i}' for i in range(30)]
+	return _uv_lock(
+		{
+			name: [
+				(dep_name, rng.choice(PYDEP_MARKER_STRS))
+				for dep_name in rng.sample(
+					names[i + 1 :] if acyclic else names,
+					min(rng.randint(0, 4), len(names) - i - 1),
+				)
+				if dep_name != name
+			]
+			for i, name in enumerate(names)
+		},
+		targets=[
+			(dep_name, rng.choice(PYDEP_MARKER_STRS))
+			for dep_name in rng.sample(names, 5)
+		],
+	)
+
+
+def _reference_graph(deps: pydeps.BLExtDeps) -> nx.DiGraph:
+	"""Dependency graph with edges from upstream to downstream, with the marker of each edge."""
+	graph = nx.DiGraph()
+	graph.add_nodes_from(deps.pydeps)
+	for pydep_node, pydeps_upstream in deps.pydeps_upstream.items():
+		for pydep_node_upstream, pydep_marker in pydeps_upstream:
+			graph.add_edge(pydep_node_upstream, pydep_node, marker=pydep_marker)
+	return graph
+
+
+####################
+# - Tests: pydeps_by
+####################
+def test_pydeps_by_follows_only_valid_markers() -> None:
+	"""Test that dependencies are only followed when their marker is valid for the platform."""
+	deps = pydeps.BLExtDeps.from_uv_lock(
+		_uv_lock(
+			{
+				'a': [
+					('b', "sys_platform == 'win32'"),
+					('c', "sys_platform == 'linux'"),
+				],
+				'b': [],
+				'c': [('d', None)],
+				'd': [],
+			},
+			targets=[('a', None)],
+		),
+		module_name='root',
+	)
+
+	assert _pydep_names_by(deps, extyp.BLPlatform.linux_x64) == {'a', 'c', 'd'}
+	assert _pydep_names_by(deps, extyp.BLPlatform.windows_x64) == {'a', 'b'}
+
+
+def test_pydeps_by_prunes_vendored_site_packages() -> None:
+	"""Test that Blender-vendored packages, and what only they depend on, are never included."""
+	assert VENDORED_PYDEP_NAME in BL_VERSION.vendored_site_packages
+	deps = pydeps.BLExtDeps.from_uv_lock(
+		_uv_lock(
+			{
+				'a': [(VENDORED_PYDEP_NAME, None), ('b', None)],
+				'b': [],
+				VENDORED_PYDEP_NAME: [('c', None)],
+				'c': [],
+			},
+			targets=[('a', None), (VENDORED_PYDEP_NAME, None)],
+		),
+		module_name='root',
+	)
+
+	assert _pydep_names_by(deps, extyp.BLPlatform.linux_x64) == {'a', 'b'}
+
+
+def test_pydeps_by_handles_cycles() -> None:
+	"""Test that cyclic dependencies are walked exactly once."""
+	deps = pydeps.BLExtDeps.from_uv_lock(
+		_uv_lock(
+			{'a': [('b', None)], 'b': [('a', None), ('c', None)], 'c': [], 'd': []},
+			targets=[('a', None)],
+		),
+		module_name='root',
+	)
+
+	assert _pydep_names_by(deps, extyp.BLPlatform.linux_x64) == {'a', 'b', 'c'}
+
+
+@pytest.mark.parametrize('acyclic', [True, False])
+@pytest.mark.parametrize('seed', range(8))
+def test_pydeps_by_matches_networkx(seed: int, *, acyclic: bool) -> None:
+	"""Test that `pydeps_by` finds the same ancestors of the targets as `networkx`."""
+	deps = pydeps.BLExtDeps.from_uv_lock(
+		_random_uv_lock(seed, acyclic=acyclic), module_name='root'
+	)
+	graph = _reference_graph(deps)
+	vendored_site_packages = BL_VERSION.vendored_site_packages
+
+	for bl_platform in BL_VERSION.valid_bl_platforms:
+
+		def is_marker_valid(
+			pydep_marker: pydeps.PyDepMarker | None,
+			bl_platform: extyp.BLPlatform = bl_platform,
+		) -> bool:
+			return pydep_marker is None or pydep_marker.is_valid_for(
+				pkg_name='root', bl_version=BL_VERSION, bl_platform=bl_platform
+			)
+
+		graph_valid = nx.subgraph_view(
+			graph,
+			filter_node=lambda pydep_node: pydep_node[0] not in vendored_site_packages,
+			filter_edge=lambda node_upstream, node, graph=graph: is_marker_valid(
+				graph[node_upstream][node]['marker']
+			),
+		)
+		pydep_targets = {
+			(name, deps.pydep_versions_by_name[name][0])
+			for name, pydep_marker in deps.target_pydeps.items()
+			if name not in vendored_site_packages and is_marker_valid(pydep_marker)
+		}
+
+		assert _pydep_names_by(deps, bl_platform) == {
+			name
+			for name, _ in pydep_targets.union(
+				*(nx.ancestors(graph_valid, target) for target in pydep_targets)
+			)
+		}
+
+
+####################
+# - Tests: pydeps_leaf_descendants
+####################
+@pytest.mark.parametrize('acyclic', [True, False])
+@pytest.mark.parametrize('seed', range(8))
+def test_pydeps_leaf_descendants_matches_networkx(seed: int, *, acyclic: bool) -> None:
+	"""Test that the leaf descendants of each node match `networkx`, with or without cycles."""
+	deps = pydeps.BLExtDeps.from_uv_lock(
+		_random_uv_lock(seed, acyclic=acyclic), module_name='root'
+	)
+	graph = _reference_graph(deps)
+
+	assert deps.pydeps_leaf_descendants == {
+		pydep_node: frozenset(
+			node
+			for node in nx.descendants(graph, pydep_node)
+			if graph.out_degree(node) == 0
+		)
+		for pydep_node in deps.pydeps
+	}
+
+
+####################
+# - Tests: wheels_by
+####################
+def _uv_lock_missing_wheel() -> frozendict[str, typ.Any]:
+	"""Make a `uv.lock`, where the target `a` depends on `b`, which has no wheels."""
+	return _uv_lock(
+		{'a': [('b', None)], 'b': [], 'c': []},
+		targets=[('a', None)],
+		names_without_wheels=frozenset({'b'}),
+	)
+
+
+def test_wheels_by_raises_on_missing_wheel() -> None:
+	"""Test that a missing wheel raises, when errors aren't passed through to the caller."""
+	deps = pydeps.BLExtDeps.from_uv_lock(_uv_lock_missing_wheel(), module_name='root')
+
+	with pytest.raises(ValueError, match='not found for'):
+		_ = deps.wheels_by(
+			pkg_name='root',
+			bl_version=BL_VERSION,
+			bl_platform=extyp.BLPlatform.linux_x64,
+		)
+
+
+def test_wheels_by_counts_missing_wheels() -> None:
+	"""Test that missing wheels are counted, when errors are passed through to the caller."""
+	deps = pydeps.BLExtDeps.from_uv_lock(_uv_lock_missing_wheel(), module_name='root')
+	bl_platform = extyp.BLPlatform.linux_x64
+
+	err_msgs: dict[extyp.BLVersion, dict[extyp.BLPlatform, list[str]]] = {
+		BL_VERSION: {bl_platform: []}
+	}
+	err_num_missing_wheels = {BL_VERSION: {bl_platform: 0}}
+	wheels = deps.wheels_by(
+		pkg_name='root',
+		bl_version=BL_VERSION,
+		bl_platform=bl_platform,
+		err_msgs=err_msgs,
+		err_num_missing_wheels=err_num_missing_wheels,
+	)
+
+	assert {wheel.pydep_name for wheel in wheels} == {'a'}
+	assert err_num_missing_wheels[BL_VERSION][bl_platform] == 1
+	assert err_msgs[BL_VERSION][bl_platform]
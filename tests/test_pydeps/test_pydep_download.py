@@ -15,3 +15,106 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 """Tests `blext.pydeps.pydep_download`."""
+
+import hashlib
+import threading
+import time
+import typing as typ
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from blext import pydeps
+
+
+####################
+# - Tests
+####################
+def test_failed_download_aborts_other_downloads(
+	tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+	"""When one download fails, the others stop, their partial wheels are deleted, and the error is raised."""
+	## - 'a-...' fails, once another download has written some data.
+	## - All other downloads only end by themselves after a generous deadline.
+	## - Only two downloads run at once, so some are still queued when 'a-...' fails.
+	wheels = frozenset({
+		pydeps.PyDepWheel(
+			url=f'https://files.pythonhosted.org/packages/{name}-1.0-py3-none-any.whl',
+			registry='https://pypi.org/simple',
+			hash='sha256:' + '0' * 64,
+			size=1,
+		)
+		for name in ('a', 'b', 'c', 'd')
+	})
+	download_started = threading.Event()
+	download_deadline = time.monotonic() + 10
+	unstopped_downloads: list[str] = []
+
+	class EndlessDownload:
+		"""Response that streams data until the download is aborted."""
+
+		def __init__(self, url: str) -> None:
+			self.url = url
+
+		def __enter__(self) -> typ.Self:
+			return self
+
+		def __exit__(self, *_: object) -> None:
+			pass
+
+		def readinto(self, buffer: bytearray) -> int:
+			download_started.set()
+			if time.monotonic() > download_deadline:
+				unstopped_downloads.append(self.url)
+				return 0
+
+			time.sleep(0.001)
+			buffer[:16] = b'x' * 16
+			return 16
+
+	def urlopen(url: str, **_: typ.Any) -> EndlessDownload:
+		if url.endswith('/a-1.0-py3-none-any.whl'):
+			_ = download_started.wait(timeout=10)
+			msg = 'connection reset'
+			raise urllib.error.URLError(msg)
+		return EndlessDownload(url)
+
+	monkeypatch.setattr(urllib.request, 'urlopen', urlopen)
+
+	finished_wheels: list[pydeps.PyDepWheel] = []
+	with pytest.raises(ValueError, match='connection reset'):
+		pydeps.download_wheels(
+			wheels,
+			path_wheels=tmp_path,
+			max_download_threads=2,
+			cb_finish_wheel_download=lambda wheel, _: finished_wheels.append(wheel),
+		)
+
+	assert download_started.is_set()
+	assert not unstopped_downloads
+	assert not finished_wheels
+	assert not list(tmp_path.iterdir())
+
+
+def test_downloaded_wheels_checks_hash(tmp_path: Path) -> None:
+	"""Only existing wheels with the expected hash count as downloaded."""
+	wheel_data = b'not really a wheel'
+	wheel_hash = 'sha256:' + hashlib.sha256(wheel_data).hexdigest()
+	wheel_valid, wheel_corrupt, wheel_missing = (
+		pydeps.PyDepWheel(
+			url=f'https://files.pythonhosted.org/packages/{name}-1.0-py3-none-any.whl',
+			registry='https://pypi.org/simple',
+			hash=wheel_hash,
+			size=len(wheel_data),
+		)
+		for name in ('valid', 'corrupt', 'missing')
+	)
+	_ = (tmp_path / wheel_valid.filename).write_bytes(wheel_data)
+	_ = (tmp_path / wheel_corrupt.filename).write_bytes(wheel_data[::-1])
+
+	assert pydeps.downloaded_wheels(
+		frozenset({wheel_valid, wheel_corrupt, wheel_missing}),
+		path_wheels=tmp_path,
+	) == frozenset({wheel_valid})